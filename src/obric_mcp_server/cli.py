@@ -8,6 +8,13 @@ Usage examples (from project root):
     PYTHONPATH=src python -m obric_mcp_server.cli find-entity \
         --short-name "Apple" --legal-name "Apple Inc"
 
+    # Several ids in one query:
+    PYTHONPATH=src python -m obric_mcp_server.cli find-entities-by-ids ID1 ID2
+    PYTHONPATH=src python -m obric_mcp_server.cli find-entities-by-tickers AAPL MSFT
+
+    # Output is compact JSON; pass --pretty (before the command) to indent it:
+    PYTHONPATH=src python -m obric_mcp_server.cli --pretty find-entity --ticker AAPL
+
 The CLI uses:
 - .env configuration (NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
 - Neo4jClient for connection
@@ -15,11 +22,29 @@ The CLI uses:
 """
 
 import argparse
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import sys
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
 
-from .config import Config
-from .llm import EmbeddingClient
+from neo4j.graph import Node, Relationship
+from neo4j.time import Date, DateTime, Duration, Time
+
+from .config import get_config
 from .neo4j import (
     EntityDB,
     NeighbourhoodDB,
@@ -29,262 +54,392 @@ from .neo4j import (
     RelationshipDetailsDB,
 )
 
+# Exact-type dispatch for values the json encoder can't handle natively. A dict
+# lookup on type(obj) avoids walking an isinstance chain for every value.
+# The DB queries project nodes with properties(...) in Cypher, so results are
+# plain dicts and the Node/Relationship entries are only a safety net.
+_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {
+    Node: lambda n: {
+        "id": n.element_id,
+        "labels": list(n.labels),
+        "properties": dict(n),
+    },
+    Relationship: lambda r: {
+        "id": r.element_id,
+        "type": r.type,
+        "properties": dict(r),
+    },
+    DateTime: DateTime.iso_format,
+    Date: Date.iso_format,
+    Time: Time.iso_format,
+    Duration: Duration.iso_format,
+}
+
+
+def _json_default(obj: Any) -> Any:
+    """``default=`` hook for json.dumps covering Neo4j graph and temporal types."""
+    fn = _SERIALIZERS.get(type(obj))
+    if fn is None and isinstance(obj, Relationship):
+        # The driver creates one Relationship subclass per relationship type.
+        fn = _SERIALIZERS[Relationship]
+    return fn(obj) if fn is not None else str(obj)
+
+
+if orjson is not None:
+
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        """Encode ``obj`` as UTF-8 JSON using orjson's C encoder.
+
+        Output is compact unless ``pretty`` is set, which indents by 2 spaces.
+        """
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option, default=_json_default)
+
+else:
+
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        """Encode ``obj`` as UTF-8 JSON using the stdlib encoder.
+
+        Output is compact unless ``pretty`` is set, which indents by 2 spaces.
+        """
+        return json.dumps(
+            obj,
+            indent=2 if pretty else None,
+            separators=(",", ": ") if pretty else (",", ":"),
+            ensure_ascii=False,
+            default=_json_default,
+        ).encode()
+
+
+def _encode_item(item: Any, _dumps: Callable[..., bytes] = _dumps) -> bytes:
+    """Encode one result item, indented to sit inside the pretty output envelope.
+
+    The encoder is bound as a default argument so the per-item loop resolves
+    it as a local rather than a module global.
+    """
+    return _dumps(item, True).replace(b"\n", b"\n    ")
+
+
+async def _stream_json(
+    meta: Dict[str, Any], key: str, items: AsyncIterable[Any], pretty: bool = False
+) -> None:
+    """Write ``{**meta, key: [items...], "count": N}`` to stdout as JSON.
+
+    Items are encoded and written one at a time instead of building the whole
+    document in memory first, so output starts as soon as the first item is
+    ready and peak memory stays at roughly one encoded item. ``items`` may be a
+    lazy iterator; ``count`` is tallied while streaming and written last. Bytes
+    go straight to ``sys.stdout.buffer``, skipping the text layer's re-encoding.
+
+    Output is compact by default; ``pretty`` indents it by 2 spaces.
+
+    If ``items`` fails part-way, the document is still closed, with the items
+    written so far and an ``"error"`` field, and the exception is re-raised so
+    the command exits non-zero.
+
+    Neo4j graph and temporal values (e.g. DateTime) are converted through
+    `_json_default`.
+    """
+    sys.stdout.flush()  # keep ordering with anything already printed
+    write = sys.stdout.buffer.write
+
+    # Envelope whitespace; items themselves are laid out by the encoder.
+    field_nl, colon = (b"\n  ", b": ") if pretty else (b"", b":")
+    item_nl = b"\n    " if pretty else b""
+    encode = _encode_item if pretty else _dumps
+
+    write(b"{")
+    for name, value in meta.items():
+        write(field_nl + _dumps(name) + colon + _dumps(value) + b",")
+    write(field_nl + _dumps(key) + colon + b"[")
+
+    count = 0
+    error: Optional[Exception] = None
+    try:
+        async for item in items:
+            write(b"," + item_nl if count else item_nl)
+            write(encode(item))
+            count += 1
+    except Exception as exc:
+        # The envelope is already on stdout; close it before re-raising.
+        error = exc
+
+    write(b"\n  ]," if count and pretty else b"],")
+    if error is not None:
+        write(field_nl + b'"error"' + colon + _dumps(str(error)) + b",")
+    write(field_nl + b'"count"' + colon + str(count).encode())
+    write(b"\n}\n" if pretty else b"}\n")
+    sys.stdout.buffer.flush()
+
+    if error is not None:
+        raise error
+
+
+async def _aiter(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Feed an already-fetched collection to `_stream_json`."""
+    for item in items:
+        yield item
+
+
+def _entity_kwargs(args: argparse.Namespace, suffix: str = "") -> Dict[str, Any]:
+    """Collect the identifier flags added by ``_add_entity_args`` as DB kwargs."""
+    return {
+        f"{key}{suffix}": getattr(args, f"{key}{suffix}")
+        for key in ("id", "ticker", "short_name", "legal_name")
+    }
+
 
-def _cmd_find_entity(args: argparse.Namespace) -> None:
+async def _cmd_find_entity(args: argparse.Namespace, client: Neo4jClient) -> None:
     """Run the generic entity lookup against Neo4j and print results."""
 
-    config = Config()
+    entitydb = EntityDB(client)
+    records = entitydb.iter_entity(
+        **_entity_kwargs(args),
+        limit=args.limit,
+    )
 
-    client = Neo4jClient(config=config)
+    await _stream_json({}, "results", records, pretty=args.pretty)
 
-    with client:
-        entitydb = EntityDB(client)
-        records = entitydb.find_entity(
-            id=args.id,
-            ticker=args.ticker,
-            short_name=args.short_name,
-            legal_name=args.legal_name,
-            limit=args.limit,
-        )
 
-    serializable: Dict[str, Any] = {
-        "count": len(records),
-        "results": records,
-    }
+async def _cmd_find_entities_by_ids(
+    args: argparse.Namespace, client: Neo4jClient
+) -> None:
+    """Look up several entities by id in one query and print them in input order."""
+
+    entitydb = EntityDB(client)
+    found = await entitydb.find_entities_by_ids(args.ids)
+
+    ids = list(dict.fromkeys(args.ids))
+    await _stream_json(
+        {"missing": [id for id in ids if id not in found]},
+        "results",
+        _aiter({"id": id, "entity": found[id]} for id in ids if id in found),
+        pretty=args.pretty,
+    )
+
 
-    print(json.dumps(serializable, indent=2, sort_keys=True))
+async def _cmd_find_entities_by_tickers(
+    args: argparse.Namespace, client: Neo4jClient
+) -> None:
+    """Look up several entities by ticker in one query and print them in input order."""
+
+    entitydb = EntityDB(client)
+    found = await entitydb.find_entities_by_tickers(args.tickers)
+
+    tickers = list(dict.fromkeys(args.tickers))
+    await _stream_json(
+        {"missing": [ticker for ticker in tickers if ticker not in found]},
+        "results",
+        _aiter(
+            {"ticker": ticker, "entity": found[ticker]}
+            for ticker in tickers
+            if ticker in found
+        ),
+        pretty=args.pretty,
+    )
 
 
-def _cmd_find_government_awards(args: argparse.Namespace) -> None:
+async def _cmd_find_government_awards(
+    args: argparse.Namespace, client: Neo4jClient
+) -> None:
     """Find government awards for an entity."""
 
-    config = Config()
-    client = Neo4jClient(config=config)
-
-    with client:
-        relationship_details_db = RelationshipDetailsDB(client)
-        records = relationship_details_db.find_government_awards(
-            id=args.id,
-            ticker=args.ticker,
-            short_name=args.short_name,
-            legal_name=args.legal_name,
-            limit=args.limit,
-        )
-
-    serializable: Dict[str, Any] = {
-        "count": len(records),
-        "results": records,
-    }
+    relationship_details_db = RelationshipDetailsDB(client)
+    records = relationship_details_db.iter_government_awards(
+        **_entity_kwargs(args),
+        limit=args.limit,
+    )
 
-    print(json.dumps(serializable, indent=2, sort_keys=True, default=str))
+    await _stream_json({}, "results", records, pretty=args.pretty)
 
 
-def _cmd_find_affiliate_entities(args: argparse.Namespace) -> None:
+async def _cmd_find_affiliate_entities(
+    args: argparse.Namespace, client: Neo4jClient
+) -> None:
     """Find affiliate entities connected through relationship types."""
 
-    config = Config()
-    client = Neo4jClient(config=config)
-
-    with client:
-        entitydb = EntityDB(client)
-        records = entitydb.find_affiliate_entities(
-            id=args.id,
-            ticker=args.ticker,
-            short_name=args.short_name,
-            legal_name=args.legal_name,
-            limit=args.limit,
-        )
-
-    serializable: Dict[str, Any] = {
-        "count": len(records),
-        "results": records,
-    }
+    entitydb = EntityDB(client)
+    records = entitydb.iter_affiliate_entities(
+        **_entity_kwargs(args),
+        limit=args.limit,
+    )
 
-    print(json.dumps(serializable, indent=2, sort_keys=True))
+    await _stream_json({}, "results", records, pretty=args.pretty)
 
 
-def _cmd_find_recent_insider_activites(args: argparse.Namespace) -> None:
+async def _cmd_find_recent_insider_activites(
+    args: argparse.Namespace, client: Neo4jClient
+) -> None:
     """Find recent insider RelationshipDetails for an entity."""
 
-    config = Config()
-    client = Neo4jClient(config=config)
-
-    with client:
-        relationship_details_db = RelationshipDetailsDB(client)
-        records = relationship_details_db.find_recent_insider_activites(
-            id=args.id,
-            ticker=args.ticker,
-            short_name=args.short_name,
-            legal_name=args.legal_name,
-            start_date=args.start_date,
-            limit=args.limit,
-        )
-
-    serializable: Dict[str, Any] = {
-        "count": len(records),
-        "results": records,
-    }
+    relationship_details_db = RelationshipDetailsDB(client)
+    records = relationship_details_db.iter_recent_insider_activites(
+        **_entity_kwargs(args),
+        start_date=args.start_date,
+        limit=args.limit,
+    )
 
-    # Use default=str to serialize Neo4j temporal types (e.g. DateTime) as strings.
-    print(json.dumps(serializable, indent=2, sort_keys=True, default=str))
+    await _stream_json({}, "results", records, pretty=args.pretty)
 
 
-def _cmd_find_person_entity_relationships(args: argparse.Namespace) -> None:
+async def _cmd_find_person_entity_relationships(
+    args: argparse.Namespace, client: Neo4jClient
+) -> None:
     """Find RelationshipDetails between an entity and a specific person."""
 
-    config = Config()
-    client = Neo4jClient(config=config)
-
-    with client:
-        relationship_details_db = RelationshipDetailsDB(client)
-        records = relationship_details_db.find_person_entity_relationships(
-            id=args.id,
-            ticker=args.ticker,
-            short_name=args.short_name,
-            legal_name=args.legal_name,
-            person_id=args.person_id,
-            person_name=args.person_name,
-            person_sec_cik=args.person_sec_cik,
-            start_date=args.start_date,
-            limit=args.limit,
-        )
-
-    serializable: Dict[str, Any] = {
-        "count": len(records),
-        "results": records,
-    }
+    relationship_details_db = RelationshipDetailsDB(client)
+    records = relationship_details_db.iter_person_entity_relationships(
+        **_entity_kwargs(args),
+        person_id=args.person_id,
+        person_name=args.person_name,
+        person_sec_cik=args.person_sec_cik,
+        start_date=args.start_date,
+        limit=args.limit,
+    )
 
-    # Neo4j may return temporal types (e.g. DateTime) that aren't JSON-serializable
-    # by default; use default=str to render them as ISO-like strings.
-    print(json.dumps(serializable, indent=2, sort_keys=True, default=str))
+    await _stream_json({}, "results", records, pretty=args.pretty)
 
 
-def _cmd_find_people_by_entity(args: argparse.Namespace) -> None:
+async def _cmd_find_people_by_entity(
+    args: argparse.Namespace, client: Neo4jClient
+) -> None:
     """Find people connected to an entity via RelationshipDetails."""
 
-    config = Config()
-    client = Neo4jClient(config=config)
-
-    with client:
-        person_db = PersonDB(client)
-        records = person_db.find_people_by_entity(
-            id=args.id,
-            ticker=args.ticker,
-            short_name=args.short_name,
-            legal_name=args.legal_name,
-            limit=args.limit,
-        )
-
-    serializable: Dict[str, Any] = {
-        "count": len(records),
-        "results": records,
-    }
+    person_db = PersonDB(client)
+    records = person_db.iter_people_by_entity(
+        **_entity_kwargs(args),
+        limit=args.limit,
+    )
 
-    print(json.dumps(serializable, indent=2, sort_keys=True, default=str))
+    await _stream_json({}, "results", records, pretty=args.pretty)
 
 
-def _cmd_find_entity_by_relationship_embedding(args: argparse.Namespace) -> None:
+async def _cmd_find_entity_by_relationship_embedding(
+    args: argparse.Namespace, client: Neo4jClient
+) -> None:
     """Find entities connected to RelationshipDetails matching an embedding similarity."""
+    # Imported here: the langchain/openai stack dominates CLI start-up and only
+    # this command needs it.
+    from .llm import EmbeddingClient
 
-    config = Config()
-    client = Neo4jClient(config=config)
-    embedding_client = EmbeddingClient(config=config)
+    embedding_client = EmbeddingClient(config=client.config)
 
     # Generate embedding from query text
-    embedding = embedding_client.embed_text(args.query)
-
-    with client:
-        entitydb = EntityDB(client)
-        records = entitydb.find_entity_by_relationship_embedding(
-            embedding=embedding,
-            threshold=args.threshold,
-            direction=args.direction,
-            limit=args.limit,
-        )
-
-    serializable: Dict[str, Any] = {
-        "count": len(records),
-        "results": records,
-    }
+    embedding = await embedding_client.aembed_text(args.query)
+
+    entitydb = EntityDB(client)
+    records = entitydb.iter_entity_by_relationship_embedding(
+        embedding=embedding,
+        threshold=args.threshold,
+        direction=args.direction,
+        limit=args.limit,
+    )
 
-    print(json.dumps(serializable, indent=2, sort_keys=True))
+    await _stream_json({}, "results", records, pretty=args.pretty)
 
 
-def _cmd_find_paths_between_entities(
-    args: argparse.Namespace,
+async def _cmd_find_paths_between_entities(
+    args: argparse.Namespace, client: Neo4jClient
 ) -> None:
     """Find all paths (entities + RelationshipDetails) between two entities."""
 
-    config = Config()
-    client = Neo4jClient(config=config)
-
-    with client:
-        path_db = PathDB(client)
-        paths = path_db.find_paths_between_entities(
-            id1=args.id1,
-            ticker1=args.ticker1,
-            short_name1=args.short_name1,
-            legal_name1=args.legal_name1,
-            id2=args.id2,
-            ticker2=args.ticker2,
-            short_name2=args.short_name2,
-            legal_name2=args.legal_name2,
-            direction=args.direction,
-            max_tier=args.max_tier,
-            max_paths=args.max_paths,
-        )
-
-    result: Dict[str, Any] = {
-        "count": len(paths),
-        "direction": args.direction,
-        "tier": args.max_tier,
-        "paths": paths,
-    }
-    print(json.dumps(result, indent=2, sort_keys=True))
+    path_db = PathDB(client)
+    # Stream paths to stdout as the driver delivers them.
+    paths = path_db.iter_paths_between_entities(
+        **_entity_kwargs(args, suffix="1"),
+        **_entity_kwargs(args, suffix="2"),
+        direction=args.direction,
+        max_tier=args.max_tier,
+        max_paths=args.max_paths,
+    )
+
+    await _stream_json(
+        {"direction": args.direction, "tier": args.max_tier},
+        "paths",
+        paths,
+        pretty=args.pretty,
+    )
 
 
-def _cmd_find_connected_entities(args: argparse.Namespace) -> None:
+async def _cmd_find_connected_entities(
+    args: argparse.Namespace, client: Neo4jClient
+) -> None:
     """Find connected entities within a tier range."""
 
-    config = Config()
-    client = Neo4jClient(config=config)
-
-    with client:
-        neighbourhood_db = NeighbourhoodDB(client)
-        records = neighbourhood_db.find_connected_entities(
-            id=args.id,
-            ticker=args.ticker,
-            short_name=args.short_name,
-            legal_name=args.legal_name,
-            min_tier=args.min_tier,
-            max_tier=args.max_tier,
-            direction=args.direction,
-            limit=args.limit,
-        )
-
-    result: Dict[str, Any] = {
-        "count": len(records),
-        "min_tier": args.min_tier,
-        "max_tier": args.max_tier,
-        "direction": args.direction,
-        "results": records
-    }
-    print(json.dumps(result, indent=2, sort_keys=True))
+    neighbourhood_db = NeighbourhoodDB(client)
+    records = neighbourhood_db.iter_connected_entities(
+        **_entity_kwargs(args),
+        min_tier=args.min_tier,
+        max_tier=args.max_tier,
+        direction=args.direction,
+        limit=args.limit,
+    )
+
+    await _stream_json(
+        {
+            "min_tier": args.min_tier,
+            "max_tier": args.max_tier,
+            "direction": args.direction,
+        },
+        "results",
+        records,
+        pretty=args.pretty,
+    )
+
+
+_DIRECTIONS = frozenset({"inbound", "outbound"})
 
 
 def _parse_direction(value: Optional[str]) -> Optional[str]:
     """Parse direction argument, allowing None for bidirectional."""
-    if value is None or value.lower() == "none":
+    if value is None:
+        return None
+    direction = value.lower()
+    if direction == "none":
         return None
-    if value.lower() not in ["inbound", "outbound"]:
+    if direction not in _DIRECTIONS:
         raise argparse.ArgumentTypeError(f'direction must be "inbound", "outbound", or None, got "{value}"')
-    return value.lower()
+    return direction
 
 
+def _add_entity_args(
+    parser: argparse.ArgumentParser, suffix: str = "", target: Optional[str] = None
+) -> None:
+    """Add the --id/--ticker/--short-name/--legal-name identifier flags.
+
+    Args:
+        parser: Subparser to add the flags to.
+        suffix: Appended to each flag and dest (e.g. "1" gives --ticker1/ticker1).
+        target: Optional description appended to each help text
+            (e.g. "the entity" gives "Ticker symbol for the entity").
+    """
+    suffix_help = f" for {target}" if target else ""
+    parser.add_argument(
+        f"--id{suffix}",
+        type=str,
+        help=f"Neo4j internal node id{suffix_help}",
+        dest=f"id{suffix}",
+    )
+    parser.add_argument(f"--ticker{suffix}", type=str, help=f"Ticker symbol{suffix_help}")
+    parser.add_argument(
+        f"--short-name{suffix}", type=str, help=f"Short name text{suffix_help}"
+    )
+    parser.add_argument(
+        f"--legal-name{suffix}", type=str, help=f"Legal name text{suffix_help}"
+    )
+
+
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (cached; parsing doesn't mutate it)."""
     parser = argparse.ArgumentParser(
         description="CLI for testing Obric MCP Neo4j functions",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output (default: compact)",
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -293,10 +448,7 @@ def build_parser() -> argparse.ArgumentParser:
         "find-entity",
         help="Generic entity lookup using id/ticker/short_name/legal_name",
     )
-    p_find.add_argument("--id", type=str, help="Neo4j internal node id", dest="id")
-    p_find.add_argument("--ticker", type=str, help="Ticker symbol")
-    p_find.add_argument("--short-name", type=str, help="Short name text")
-    p_find.add_argument("--legal-name", type=str, help="Legal name text")
+    _add_entity_args(p_find)
     p_find.add_argument(
         "--limit",
         type=int,
@@ -305,15 +457,36 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_find.set_defaults(func=_cmd_find_entity)
 
+    # find-entities-by-ids command
+    p_find_by_ids = subparsers.add_parser(
+        "find-entities-by-ids",
+        help="Look up several entities by Neo4j internal node id in one query",
+    )
+    p_find_by_ids.add_argument(
+        "ids",
+        nargs="+",
+        help="Neo4j internal node ids",
+    )
+    p_find_by_ids.set_defaults(func=_cmd_find_entities_by_ids)
+
+    # find-entities-by-tickers command
+    p_find_by_tickers = subparsers.add_parser(
+        "find-entities-by-tickers",
+        help="Look up several entities by ticker (case-insensitive) in one query",
+    )
+    p_find_by_tickers.add_argument(
+        "tickers",
+        nargs="+",
+        help="Ticker symbols",
+    )
+    p_find_by_tickers.set_defaults(func=_cmd_find_entities_by_tickers)
+
     # find-affiliate-entities command
     p_find_affiliate = subparsers.add_parser(
         "find-affiliate-entities",
         help="Find affiliate entities connected through relationship types",
     )
-    p_find_affiliate.add_argument("--id", type=str, help="Neo4j internal node id", dest="id")
-    p_find_affiliate.add_argument("--ticker", type=str, help="Ticker symbol")
-    p_find_affiliate.add_argument("--short-name", type=str, help="Short name text")
-    p_find_affiliate.add_argument("--legal-name", type=str, help="Legal name text")
+    _add_entity_args(p_find_affiliate)
     p_find_affiliate.add_argument(
         "--limit",
         type=int,
@@ -327,10 +500,7 @@ def build_parser() -> argparse.ArgumentParser:
         "find-government-awards",
         help="Find government awards for an entity (RelationshipDetails with 'awarded_to' relationship type)",
     )
-    p_find_awards.add_argument("--id", type=str, help="Neo4j internal node id", dest="id")
-    p_find_awards.add_argument("--ticker", type=str, help="Ticker symbol")
-    p_find_awards.add_argument("--short-name", type=str, help="Short name text")
-    p_find_awards.add_argument("--legal-name", type=str, help="Legal name text")
+    _add_entity_args(p_find_awards)
     p_find_awards.add_argument(
         "--limit",
         type=int,
@@ -347,18 +517,7 @@ def build_parser() -> argparse.ArgumentParser:
             "Uses the 'Insider' sublabel and optional start_date filter."
         ),
     )
-    p_find_insider.add_argument(
-        "--id", type=str, help="Neo4j internal node id", dest="id"
-    )
-    p_find_insider.add_argument(
-        "--ticker", type=str, help="Ticker symbol for the entity"
-    )
-    p_find_insider.add_argument(
-        "--short-name", type=str, help="Short name text for the entity"
-    )
-    p_find_insider.add_argument(
-        "--legal-name", type=str, help="Legal name text for the entity"
-    )
+    _add_entity_args(p_find_insider, target="the entity")
     p_find_insider.add_argument(
         "--start-date",
         type=str,
@@ -386,18 +545,7 @@ def build_parser() -> argparse.ArgumentParser:
         ),
     )
     # Entity arguments
-    p_find_person_entity_rels.add_argument(
-        "--id", type=str, help="Neo4j internal node id for the entity", dest="id"
-    )
-    p_find_person_entity_rels.add_argument(
-        "--ticker", type=str, help="Ticker symbol for the entity"
-    )
-    p_find_person_entity_rels.add_argument(
-        "--short-name", type=str, help="Short name text for the entity"
-    )
-    p_find_person_entity_rels.add_argument(
-        "--legal-name", type=str, help="Legal name text for the entity"
-    )
+    _add_entity_args(p_find_person_entity_rels, target="the entity")
     # Person arguments
     p_find_person_entity_rels.add_argument(
         "--person-id", type=str, help="Internal person id", dest="person_id"
@@ -441,18 +589,7 @@ def build_parser() -> argparse.ArgumentParser:
             "segments (Entity - RelationshipDetail - Person)."
         ),
     )
-    p_find_people_by_entity.add_argument(
-        "--id", type=str, help="Neo4j internal node id for the entity", dest="id"
-    )
-    p_find_people_by_entity.add_argument(
-        "--ticker", type=str, help="Ticker symbol for the entity"
-    )
-    p_find_people_by_entity.add_argument(
-        "--short-name", type=str, help="Short name text for the entity"
-    )
-    p_find_people_by_entity.add_argument(
-        "--legal-name", type=str, help="Legal name text for the entity"
-    )
+    _add_entity_args(p_find_people_by_entity, target="the entity")
     p_find_people_by_entity.add_argument(
         "--limit",
         type=int,
@@ -501,31 +638,9 @@ def build_parser() -> argparse.ArgumentParser:
         ),
     )
     # Entity 1 arguments
-    p_find_paths.add_argument(
-        "--id1", type=str, help="Neo4j internal node id for first entity", dest="id1"
-    )
-    p_find_paths.add_argument(
-        "--ticker1", type=str, help="Ticker symbol for first entity"
-    )
-    p_find_paths.add_argument(
-        "--short-name1", type=str, help="Short name text for first entity"
-    )
-    p_find_paths.add_argument(
-        "--legal-name1", type=str, help="Legal name text for first entity"
-    )
+    _add_entity_args(p_find_paths, suffix="1", target="first entity")
     # Entity 2 arguments
-    p_find_paths.add_argument(
-        "--id2", type=str, help="Neo4j internal node id for second entity", dest="id2"
-    )
-    p_find_paths.add_argument(
-        "--ticker2", type=str, help="Ticker symbol for second entity"
-    )
-    p_find_paths.add_argument(
-        "--short-name2", type=str, help="Short name text for second entity"
-    )
-    p_find_paths.add_argument(
-        "--legal-name2", type=str, help="Legal name text for second entity"
-    )
+    _add_entity_args(p_find_paths, suffix="2", target="second entity")
     p_find_paths.add_argument(
         "--direction",
         type=_parse_direction,
@@ -553,18 +668,7 @@ def build_parser() -> argparse.ArgumentParser:
         "find-connected-entities",
         help="Find connected entities within a tier range (neighborhood query)",
     )
-    p_find_connected.add_argument(
-        "--id", type=str, help="Neo4j internal node id for the starting entity", dest="id"
-    )
-    p_find_connected.add_argument(
-        "--ticker", type=str, help="Ticker symbol for the starting entity"
-    )
-    p_find_connected.add_argument(
-        "--short-name", type=str, help="Short name text for the starting entity"
-    )
-    p_find_connected.add_argument(
-        "--legal-name", type=str, help="Legal name text for the starting entity"
-    )
+    _add_entity_args(p_find_connected, target="the starting entity")
     p_find_connected.add_argument(
         "--min-tier",
         type=int,
@@ -594,6 +698,40 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# The driver's default Bolt fetch size; never ask for larger batches than this.
+_MAX_FETCH_SIZE = 1000
+
+
+def _session_kwargs(args: argparse.Namespace) -> Dict[str, Any]:
+    """Session options for a command, sized to its row cap.
+
+    Matching ``fetch_size`` to ``--limit``/``--max-paths`` lets a capped result
+    arrive in a single PULL without the driver buffering rows that will never be
+    printed, and keeps streamed path output flowing in small batches.
+    """
+    row_cap = getattr(args, "limit", None) or getattr(args, "max_paths", None)
+    if not row_cap or row_cap <= 0:
+        return {}
+    return {"fetch_size": min(row_cap, _MAX_FETCH_SIZE)}
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run one subcommand against its own client, then close the driver.
+
+    The CLI runs a single command per process and the async driver is bound to
+    the event loop ``asyncio.run`` creates for it, so the client lives exactly
+    as long as that loop.
+    """
+    client = Neo4jClient(config=get_config())
+    try:
+        # Open one session for the whole command. DB helpers that return a
+        # list reuse it; streaming ones open their own with the same options.
+        async with client.session(**_session_kwargs(args)):
+            await args.func(args, client)
+    finally:
+        await client.close()
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
@@ -602,7 +740,7 @@ def main() -> None:
         parser.print_help()
         return
 
-    args.func(args)
+    asyncio.run(_run(args))
 
 
 if __name__ == "__main__":
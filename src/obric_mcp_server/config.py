@@ -12,9 +12,10 @@ Example .env:
     LOG_LEVEL=INFO
 """
 
+from functools import lru_cache
 from typing import Optional
 
-from pydantic import AnyUrl, Field
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -26,9 +27,11 @@ class Config(BaseSettings):
     """
 
     # Neo4j configuration
-    neo4j_uri: AnyUrl = Field(
+    # Only the scheme is checked here; the driver parses the full URI itself.
+    neo4j_uri: str = Field(
         ...,
         alias="NEO4J_URI",
+        pattern=r"^(bolt|neo4j)(\+s|\+ssc)?://.+",
         description="Neo4j connection URI, e.g. bolt://localhost:7687",
     )
     neo4j_username: str = Field(
@@ -56,6 +59,24 @@ class Config(BaseSettings):
         alias="NEO4J_MAX_CONNECTION_POOL_SIZE",
         description="Maximum number of connections in the Neo4j pool",
     )
+    neo4j_connection_acquisition_timeout: float = Field(
+        60.0,
+        alias="NEO4J_CONNECTION_ACQUISITION_TIMEOUT",
+        description="Seconds to wait for a free pooled connection before failing",
+    )
+    neo4j_ensure_schema: bool = Field(
+        False,
+        alias="NEO4J_ENSURE_SCHEMA",
+        description="Create the indexes/constraints the queries use when connecting",
+    )
+    neo4j_use_vector_index: bool = Field(
+        False,
+        alias="NEO4J_USE_VECTOR_INDEX",
+        description=(
+            "Search RelationshipDetail embeddings through the vector index "
+            "instead of scanning every node"
+        ),
+    )
 
     # Server configuration
     log_level: str = Field(
@@ -63,6 +84,21 @@ class Config(BaseSettings):
         alias="LOG_LEVEL",
         description="Log level for server / CLI (e.g. DEBUG, INFO, WARN, ERROR)",
     )
+    mcp_host: str = Field(
+        "0.0.0.0",
+        alias="MCP_HOST",
+        description="Interface the MCP HTTP server binds to",
+    )
+    mcp_port: int = Field(
+        8000,
+        alias="MCP_PORT",
+        description="Port the MCP HTTP server listens on",
+    )
+    mcp_path: str = Field(
+        "/",
+        alias="MCP_PATH",
+        description="URL path of the streamable HTTP endpoint",
+    )
 
     # OpenAI configuration
     openai_api_key: str = Field(
@@ -80,5 +116,15 @@ class Config(BaseSettings):
         case_sensitive=True,  # we use explicit aliases, so keep env lookup strict
         extra="ignore",
         populate_by_name=False,
+        # Build the validation schema on first instantiation (via get_config())
+        # instead of at import time.
+        defer_build=True,
+        # Settings are read once per process and shared; make that explicit.
+        frozen=True,
     )
 
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, reading the environment / .env only once."""
+    return Config()
@@ -4,12 +4,16 @@ This module provides the EmbeddingClient class for generating embeddings
 from text using OpenAI's embedding models.
 """
 
+import asyncio
 import logging
-from typing import List, Optional
+import threading
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 
+from cachetools import TTLCache
 from langchain_openai import OpenAIEmbeddings
 
-from ..config import Config
+from ..config import Config, get_config
 
 logger = logging.getLogger(__name__)
 
@@ -17,35 +21,48 @@ logger = logging.getLogger(__name__)
 class EmbeddingClient:
     """Generic LangChain embedding client wrapper for text embedding extraction."""
 
-    def __init__(self, config: Config):
+    # How long `aembed_text` waits for other concurrent callers before sending
+    # the pending texts as one batched request.
+    BATCH_WINDOW_SECONDS = 0.005
+
+    # Embeddings are cached per text so repeated queries skip the API call.
+    CACHE_MAXSIZE = 10_000
+    CACHE_TTL_SECONDS = 3600
+
+    def __init__(self, config: Optional[Config] = None):
         """Initialize embedding client with configuration.
 
         Args:
-            config: Application configuration instance.
+            config: Application configuration instance. Defaults to the shared
+                process-wide config.
         """
-        self.config = config
-        self._embeddings: Optional[OpenAIEmbeddings] = None
-
-    @property
+        self.config = config or get_config()
+        # Texts queued by `aembed_text`, awaiting the next batched request.
+        self._pending: List[Tuple[str, "asyncio.Future[List[float]]"]] = []
+        self._flush_task: Optional["asyncio.Task[None]"] = None
+        # Keyed by text alone: model and dimensions are fixed for this client.
+        self._cache: TTLCache = TTLCache(
+            maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL_SECONDS
+        )
+        self._cache_lock = threading.Lock()
+
+    @cached_property
     def embeddings(self) -> OpenAIEmbeddings:
         """Get or create the embeddings instance.
 
+        Built on first access and then stored on the instance, so later
+        accesses are a plain attribute lookup.
+
         Returns:
             OpenAIEmbeddings instance, lazily initialized.
         """
-        if self._embeddings is None:
-            if self.config.embedding_dimensions is not None:
-                self._embeddings = OpenAIEmbeddings(
-                    model=self.config.embedding_model_name,
-                    api_key=self.config.openai_api_key,
-                    dimensions=self.config.embedding_dimensions,
-                )
-            else:
-                self._embeddings = OpenAIEmbeddings(
-                    model=self.config.embedding_model_name,
-                    api_key=self.config.openai_api_key,
-                )
-        return self._embeddings
+        kwargs: Dict[str, Any] = {
+            "model": self.config.embedding_model_name,
+            "api_key": self.config.openai_api_key,
+        }
+        if self.config.embedding_dimensions is not None:
+            kwargs["dimensions"] = self.config.embedding_dimensions
+        return OpenAIEmbeddings(**kwargs)
 
     def embed_text(self, text: str) -> List[float]:
         """Generate embedding for a single text string.
@@ -59,14 +76,106 @@ class EmbeddingClient:
         Raises:
             Exception: If embedding extraction fails.
         """
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
         try:
             # Use embed_documents for both single and batch (it supports both)
             results = self.embeddings.embed_documents([text])
-            return results[0] if results else []
         except Exception as e:
             logger.error(f"Embedding extraction failed for text: {e}", exc_info=True)
             raise
 
+        if not results:
+            return []
+        self._cache_put([text], results)
+        return results[0]
+
+    async def aembed_text(self, text: str) -> List[float]:
+        """Generate embedding for a single text, batched with concurrent callers.
+
+        Calls made within `BATCH_WINDOW_SECONDS` of each other on the same event
+        loop are sent to OpenAI as a single request, with each distinct text
+        sent once, and each caller receives its own vector.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            List of float values representing the embedding vector
+
+        Raises:
+            Exception: If embedding extraction fails.
+        """
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[List[float]]" = loop.create_future()
+        self._pending.append((text, future))
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_pending())
+            self._flush_task.add_done_callback(self._settle_untaken)
+        return await future
+
+    async def _flush_pending(self) -> None:
+        """Send every text queued by `aembed_text` as one batched request.
+
+        Every queued future is settled before this returns: with its vector,
+        with the request's error, or cancelled if this task is cancelled.
+        """
+        batch: Optional[List[Tuple[str, "asyncio.Future[List[float]]"]]] = None
+        try:
+            await asyncio.sleep(self.BATCH_WINDOW_SECONDS)
+            batch = self._take_pending()
+            # Identical texts queued in the same window are requested once.
+            texts = list(dict.fromkeys(text for text, _ in batch))
+            results = await self.embeddings.aembed_documents(texts)
+            if len(results) != len(texts):
+                raise RuntimeError(
+                    f"Embedding request returned {len(results)} vectors "
+                    f"for {len(texts)} texts"
+                )
+            self._cache_put(texts, results)
+            by_text = dict(zip(texts, results, strict=True))
+            for text, future in batch:
+                if not future.done():
+                    # Each caller gets its own list, even for a shared text.
+                    future.set_result(list(by_text[text]))
+        except Exception as e:
+            logger.error(
+                f"Batched embedding extraction failed for {len(batch or [])} texts: {e}",
+                exc_info=True,
+            )
+            for _, future in batch or []:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Only reached with unsettled futures on cancellation (or another
+            # BaseException); don't leave their callers waiting forever.
+            for _, future in batch or []:
+                if not future.done():
+                    future.cancel()
+
+    def _settle_untaken(self, task: "asyncio.Task[None]") -> None:
+        """Cancel queued callers if the flush task ended before taking the batch.
+
+        Happens when the task is cancelled during its batching window, or
+        before it first runs (e.g. at event loop shutdown).
+        """
+        if self._flush_task is task:
+            for _, future in self._take_pending():
+                if not future.done():
+                    future.cancel()
+
+    def _take_pending(self) -> List[Tuple[str, "asyncio.Future[List[float]]"]]:
+        """Detach the queued texts so that later calls start a new batch."""
+        batch, self._pending = self._pending, []
+        self._flush_task = None
+        return batch
+
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for a batch of text strings.
 
@@ -82,10 +191,45 @@ class EmbeddingClient:
         if not texts:
             return []
 
-        try:
-            results = self.embeddings.embed_documents(texts)
-            return results
-        except Exception as e:
-            logger.error(f"Batch embedding extraction failed: {e}", exc_info=True)
-            raise
+        found: Dict[str, List[float]] = {}
+        for text in dict.fromkeys(texts):
+            cached = self._cache_get(text)
+            if cached is not None:
+                found[text] = cached
+        # Only request texts not already cached, each once.
+        missing = list(dict.fromkeys(text for text in texts if text not in found))
+
+        if missing:
+            try:
+                results = self.embeddings.embed_documents(missing)
+            except Exception as e:
+                logger.error(f"Batch embedding extraction failed: {e}", exc_info=True)
+                raise
+            if len(results) != len(missing):
+                raise RuntimeError(
+                    f"Embedding request returned {len(results)} vectors "
+                    f"for {len(missing)} texts"
+                )
+            self._cache_put(missing, results)
+            found.update(zip(missing, results, strict=True))
+
+        # A fresh list per position, so duplicate texts don't share one vector.
+        return [list(found[text]) for text in texts]
+
+    def _cache_get(self, text: str) -> Optional[List[float]]:
+        """Return a copy of the cached embedding for ``text``, if any.
+
+        Vectors are copied on the way in and out, so a caller mutating a
+        returned list can't corrupt the cache for later callers.
+        """
+        with self._cache_lock:
+            cached = self._cache.get(text)
+        return list(cached) if cached is not None else None
+
+    def _cache_put(self, texts: List[str], embeddings: List[List[float]]) -> None:
+        """Cache a copy of ``embeddings`` for the corresponding ``texts``."""
+        copies = [list(embedding) for embedding in embeddings]
+        with self._cache_lock:
+            for text, embedding in zip(texts, copies, strict=True):
+                self._cache[text] = embedding
 
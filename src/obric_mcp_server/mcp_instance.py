@@ -5,37 +5,22 @@ so that there is exactly one FastMCP and one Neo4j client/EntityDB/PathDB
 per process.
 """
 
-from mcp.server.fastmcp import FastMCP
+from typing import TYPE_CHECKING, Any
 
-from .config import Config
+from .config import get_config
 from .llm import EmbeddingClient
 from .neo4j import EntityDB, NeighbourhoodDB, Neo4jClient, PathDB, PersonDB, RelationshipDetailsDB
 
-# Single shared MCP server instance
-mcp = FastMCP(
-    "obric-mcp-server-mvp",
-    host='0.0.0.0',
-    streamable_http_path="/",
-    port=8000
-    # description='''An MCP server to deal with complex relationship data between different type of entities.
-    # Entities can be companies, commettes, regulators, NGOs etc. Each 2 Entities may have multiple relationships between them.
-    # Each Relationship contains details about the specific connections between the 2 Entities.
-    # Those connections can be ownership, supply-chain, partnership, regulation, investment, services, etc.
-
-    # Entities contain metadata about the entity like name, ticker, short name, legal name, entity type, etc.
-    # Relationship Details contain metadata about the relationship like description, relationship type, source url, created at, etc.
-
-    # The direction of relationship matters. Entity1 -> Entity2 is different from Entity2 -> Entity1.
-    # This info is often provided in the tools results.
-
-    # The path between 2 Entities is an ordered sequence of Entities (and may include Relationship Details).
-    # Each level of depth in the path is called a tier.
-    # Tier-N entities are the entities that are N steps away from the starting entity 
-    # in the given direction: either inbound or outbound.''',
-    )
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
+    # Built lazily by `__getattr__` below; declared here for type checkers and
+    # so `__all__` names only attributes the module defines.
+    mcp: FastMCP
+    tool: Any
 
 # Shared Neo4j wiring for all tools
-config = Config()
+config = get_config()
 neo4j_client = Neo4jClient(config=config)
 entitydb = EntityDB(neo4j_client)
 neighbourhooddb = NeighbourhoodDB(neo4j_client)
@@ -44,8 +29,49 @@ relationship_detailsdb = RelationshipDetailsDB(neo4j_client)
 persondb = PersonDB(neo4j_client)
 embedding_client = EmbeddingClient(config=config)
 
-# Convenience alias for defining tools bound to this server
-tool = mcp.tool
+
+def _build_mcp() -> "FastMCP":
+    """Create the shared FastMCP server, bound to the configured host/port/path."""
+    from mcp.server.fastmcp import FastMCP
+
+    return FastMCP(
+        "obric-mcp-server-mvp",
+        host=config.mcp_host,
+        streamable_http_path=config.mcp_path,
+        port=config.mcp_port,
+        # description='''An MCP server to deal with complex relationship data between different type of entities.
+        # Entities can be companies, commettes, regulators, NGOs etc. Each 2 Entities may have multiple relationships between them.
+        # Each Relationship contains details about the specific connections between the 2 Entities.
+        # Those connections can be ownership, supply-chain, partnership, regulation, investment, services, etc.
+    
+        # Entities contain metadata about the entity like name, ticker, short name, legal name, entity type, etc.
+        # Relationship Details contain metadata about the relationship like description, relationship type, source url, created at, etc.
+    
+        # The direction of relationship matters. Entity1 -> Entity2 is different from Entity2 -> Entity1.
+        # This info is often provided in the tools results.
+    
+        # The path between 2 Entities is an ordered sequence of Entities (and may include Relationship Details).
+        # Each level of depth in the path is called a tier.
+        # Tier-N entities are the entities that are N steps away from the starting entity 
+        # in the given direction: either inbound or outbound.''',
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Build `mcp` (and its `tool` decorator) on first access (PEP 562).
+
+    Importing this module for the Neo4j / embedding wiring alone then doesn't
+    load FastMCP and its web-server dependencies.
+    """
+    if name in ("mcp", "tool"):
+        server = _build_mcp()
+        # Single shared MCP server instance; cache so later lookups are direct.
+        globals()["mcp"] = server
+        # Convenience alias for defining tools bound to this server
+        globals()["tool"] = server.tool
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "mcp",
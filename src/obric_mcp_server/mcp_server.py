@@ -2,33 +2,52 @@
 MCP Server implementation for Obric
 
 This module is the entrypoint used when running the MCP server process.
-It imports the shared `mcp` instance and all MCP tools so they are
-registered on the same FastMCP server.
+On startup it imports the shared `mcp` instance and all MCP tools so they
+are registered on the same FastMCP server.
 """
 
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING, Any
 
-logging.basicConfig(
-    level=logging.INFO,
-    handlers=[logging.FileHandler("/tmp/obric_mcp_server.log")]
-)
-
-# Import tools so their @tool decorators run and register them on `mcp`.
-from .tools import path as path_tools  # noqa: F401
-from .tools import entity as entity_tools  # noqa: F401
-from .tools import neighbourhood as neighbourhood_tools  # noqa: F401
-from .tools import person as person_tools  # noqa: F401
-from .tools import relationships as relationships_tools  # noqa: F401
-from .mcp_instance import mcp  # shared FastMCP instance
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
 
+    # Resolved lazily by `__getattr__` below; declared here for type checkers.
+    mcp: FastMCP
 
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve `mcp` lazily so importing this module stays cheap (PEP 562)."""
+    if name == "mcp":
+        from .mcp_instance import mcp
+
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main() -> None:
     """Main entry point for the MCP server."""
+    # Configured here rather than at import so importing this module doesn't
+    # open the log file as a side effect.
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[logging.FileHandler("/tmp/obric_mcp_server.log")]
+    )
+
+    # Imported here rather than at module level: mcp_instance pulls in FastMCP,
+    # langchain/openai and the Neo4j driver, which only the running server needs.
+    # Importing the tools runs their @tool decorators, registering them on `mcp`.
+    from .tools import path as path_tools  # noqa: F401
+    from .tools import entity as entity_tools  # noqa: F401
+    from .tools import neighbourhood as neighbourhood_tools  # noqa: F401
+    from .tools import person as person_tools  # noqa: F401
+    from .tools import relationships as relationships_tools  # noqa: F401
+    from .mcp_instance import mcp  # shared FastMCP instance
+
     # Ensure both loggers respect the DEBUG level
     logger.info("Starting Obric MCP server 'obric-mcp-server-mvp'...")
     # Run the shared FastMCP instance; this will block the current process.
@@ -0,0 +1,56 @@
+"""In-process TTL cache for read-only query results."""
+
+import threading
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional
+
+from cachetools import TTLCache
+
+
+class ResultCache:
+    """Thread-safe TTL cache of query result records, keyed by normalized arguments.
+
+    Records are dicts. They are copied on the way in and on every hit, so a
+    caller adding, removing or replacing keys of a returned record (or of the
+    list) doesn't affect the cached result. Nested values are not copied.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of the cached records for ``key``, if any."""
+        with self._lock:
+            cached = self._cache.get(key)
+        return [dict(record) for record in cached] if cached is not None else None
+
+    def put(self, key: Hashable, records: List[Dict[str, Any]]) -> None:
+        """Cache a copy of ``records`` under ``key``."""
+        snapshot = [dict(record) for record in records]
+        with self._lock:
+            self._cache[key] = snapshot
+
+    async def stream(
+        self, key: Hashable, records: AsyncIterator[Dict[str, Any]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield ``records`` and cache them under ``key`` once exhausted.
+
+        A stream that is closed or fails before its end is not cached, since
+        its records may be incomplete.
+        """
+        seen: List[Dict[str, Any]] = []
+        async for record in records:
+            seen.append(dict(record))
+            yield record
+        self.put(key, seen)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._cache.clear()
+
+
+async def replay(records: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+    """Yield cached ``records`` with the same interface as a live stream."""
+    for record in records:
+        yield record
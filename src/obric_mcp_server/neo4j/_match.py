@@ -0,0 +1,125 @@
+"""Shared MATCH/WHERE clause for entity identification.
+
+Used by `EntityDB`, `NeighbourhoodDB` and `PathDB` so every lookup resolves
+an entity with the same priority:
+
+1. Internal Neo4j node id (exact match)
+2. Ticker (case-insensitive exact match)
+3. Short name / legal name (fuzzy CONTAINS search)
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+
+def norm(value: Optional[str]) -> Optional[str]:
+    """Normalize string inputs: strip whitespace, treat empty as None."""
+    if value is None:
+        return None
+    v = value.strip()
+    return v if v else None
+
+
+def _name_condition(var: str, param: str) -> str:
+    """Fuzzy match of lower-cased `$param` against both name properties of `var`."""
+    return (
+        f"(toLower({var}.short_name) CONTAINS ${param} "
+        f"OR toLower({var}.legal_name) CONTAINS ${param})"
+    )
+
+
+@lru_cache(maxsize=None)
+def compiled_match(entity_var: str, mode: str, param_prefix: str = "") -> str:
+    """Return the MATCH/WHERE clause for one lookup shape.
+
+    The text depends only on its arguments, so it is built once per
+    shape and identical lookups always send identical query text, which keeps
+    Neo4j's plan cache warm.
+
+    Args:
+        entity_var: Cypher variable to bind the entity to.
+        mode: One of "id", "ticker", "short", "legal" or "short_legal".
+        param_prefix: Prefix for the parameter names, so two matches can be
+            combined in one query (e.g. "e1_" gives `$e1_id`).
+    """
+    p = param_prefix
+    if mode == "id":
+        return f"MATCH ({entity_var}:Entity) WHERE {entity_var}.id = ${p}id"
+    if mode == "ticker":
+        return (
+            f"MATCH ({entity_var}:Entity) "
+            f"WHERE toLower({entity_var}.ticker) = ${p}ticker"
+        )
+    if mode == "short":
+        where = _name_condition(entity_var, f"{p}short_name")
+    elif mode == "legal":
+        where = _name_condition(entity_var, f"{p}legal_name")
+    elif mode == "short_legal":
+        where = (
+            f"{_name_condition(entity_var, p + 'short_name')} "
+            f"OR {_name_condition(entity_var, p + 'legal_name')}"
+        )
+    else:
+        raise ValueError(f"Unknown entity match mode: {mode!r}")
+    return f"MATCH ({entity_var}:Entity) WHERE {where}"
+
+
+def norm_lower(value: Optional[str]) -> Optional[str]:
+    """Like `norm`, but also lower-case the value."""
+    v = norm(value)
+    return v.lower() if v is not None else None
+
+
+def build_entity_match(
+    *,
+    entity_var: str = "n",
+    id: Optional[str] = None,
+    ticker: Optional[str] = None,
+    short_name: Optional[str] = None,
+    legal_name: Optional[str] = None,
+    param_prefix: str = "",
+) -> tuple[str, Dict[str, Any]]:
+    """Build MATCH/WHERE clause and params for entity identification.
+
+    Parameter names are prefixed with ``param_prefix`` in both the clause and
+    the returned params.
+
+    Ticker and name values are lower-cased here, once, so the query only
+    lower-cases the stored properties.
+
+    Raises:
+        ValueError: If no identifier is given.
+    """
+    p = param_prefix
+    ticker = norm_lower(ticker)
+    short_name = norm_lower(short_name)
+    legal_name = norm_lower(legal_name)
+
+    # 1) Highest priority: internal Neo4j id
+    if id is not None:
+        return compiled_match(entity_var, "id", p), {f"{p}id": id}
+
+    # 2) Second priority: ticker (exact, case-insensitive match)
+    if ticker is not None:
+        return compiled_match(entity_var, "ticker", p), {f"{p}ticker": ticker}
+
+    # 3) Fallback: short_name / legal_name fuzzy search
+    if short_name is None and legal_name is None:
+        raise ValueError(
+            "At least one of short_name or legal_name must be provided "
+            "when id and ticker are not given."
+        )
+
+    params: Dict[str, Any] = {}
+    if short_name is not None:
+        params[f"{p}short_name"] = short_name
+    if legal_name is not None:
+        params[f"{p}legal_name"] = legal_name
+
+    if short_name is not None and legal_name is not None:
+        mode = "short_legal"
+    elif short_name is not None:
+        mode = "short"
+    else:
+        mode = "legal"
+    return compiled_match(entity_var, mode, p), params
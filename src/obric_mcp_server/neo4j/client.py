@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from contextlib import contextmanager
-from typing import Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
-from neo4j import Driver, GraphDatabase, Session
+from neo4j import READ_ACCESS, AsyncDriver, AsyncGraphDatabase, AsyncSession
 
-from ..config import Config
+from ..config import Config, get_config
+from .schema import RELATIONSHIP_EMBEDDING_INDEX_STATEMENT, SCHEMA_STATEMENTS
 
 logger = logging.getLogger(__name__)
 
@@ -18,77 +21,167 @@ class Neo4jClient:
 
     def __init__(self, config: Optional[Config] = None) -> None:
         """Initialize Neo4j client with configuration."""
-        self.config = config or Config()
-        self._driver: Optional[Driver] = None
-
-    def connect(self) -> None:
+        self.config = config or get_config()
+        self._driver: Optional[AsyncDriver] = None
+        self._connect_lock = asyncio.Lock()
+        # Session opened by `session()` in this context (thread / task), if
+        # any, with the kwargs it was opened with.
+        self._active_session: ContextVar[
+            Optional[Tuple[AsyncSession, Dict[str, Any]]]
+        ] = ContextVar(f"neo4j_active_session_{id(self)}", default=None)
+
+    async def connect(self) -> None:
         """Establish connection to Neo4j database."""
-        if self._driver is None:
-            if not self.config.neo4j_password:
-                logger.error(
-                    "NEO4J_PASSWORD not set in environment variables or .env file"
-                )
-                raise ValueError(
-                    "NEO4J_PASSWORD must be set in environment variables or .env file"
+        # Serialize so concurrent first queries don't each create a driver.
+        async with self._connect_lock:
+            if self._driver is None:
+                if not self.config.neo4j_password:
+                    logger.error(
+                        "NEO4J_PASSWORD not set in environment variables or .env file"
+                    )
+                    raise ValueError(
+                        "NEO4J_PASSWORD must be set in environment variables or .env file"
+                    )
+
+                self._driver = AsyncGraphDatabase.driver(
+                    self.config.neo4j_uri,
+                    auth=(self.config.neo4j_username, self.config.neo4j_password),
+                    max_connection_lifetime=self.config.neo4j_max_connection_lifetime,
+                    max_connection_pool_size=self.config.neo4j_max_connection_pool_size,
+                    connection_acquisition_timeout=(
+                        self.config.neo4j_connection_acquisition_timeout
+                    ),
                 )
 
-            self._driver = GraphDatabase.driver(
-                str(self.config.neo4j_uri),
-                auth=(self.config.neo4j_username, self.config.neo4j_password),
-                max_connection_lifetime=self.config.neo4j_max_connection_lifetime,
-                max_connection_pool_size=self.config.neo4j_max_connection_pool_size,
+                # Verify connectivity immediately - driver creation is lazy and doesn't
+                # actually connect.
+                try:
+                    await self._driver.verify_connectivity()
+                except Exception as e:
+                    logger.error(f"Failed to connect to Neo4j: {e}")
+                    await self._driver.close()
+                    self._driver = None
+                    raise ConnectionError(
+                        f"Cannot connect to Neo4j database at {self.config.neo4j_uri}. "
+                        "Please ensure Neo4j is running and accessible."
+                    ) from e
+
+                if self.config.neo4j_ensure_schema:
+                    await self.ensure_schema()
+
+    async def ensure_schema(self) -> None:
+        """Create the indexes and constraints in `SCHEMA_STATEMENTS`.
+
+        The RelationshipDetail embedding vector index is included when the
+        embedding dimensions are configured.
+
+        Best effort: a statement that fails (e.g. missing schema privileges or
+        data violating a constraint) is logged and skipped, since queries still
+        work without it, only slower.
+        """
+        if self._driver is None:
+            await self.connect()
+
+        assert self._driver is not None  # for type checkers
+        statements = list(SCHEMA_STATEMENTS)
+        if self.config.embedding_dimensions is not None:
+            statements.append(
+                RELATIONSHIP_EMBEDDING_INDEX_STATEMENT.format(
+                    dimensions=int(self.config.embedding_dimensions)
+                )
             )
 
-            # Verify connectivity immediately - driver creation is lazy and doesn't
-            # actually connect.
-            try:
-                self._driver.verify_connectivity()
-            except Exception as e:
-                logger.error(f"Failed to connect to Neo4j: {e}")
-                self._driver.close()
-                self._driver = None
-                raise ConnectionError(
-                    f"Cannot connect to Neo4j database at {self.config.neo4j_uri}. "
-                    "Please ensure Neo4j is running and accessible."
-                ) from e
-
-    def close(self) -> None:
+        database = self.config.neo4j_database
+        async with self._driver.session(database=database) as session:
+            for statement in statements:
+                try:
+                    result = await session.run(statement)
+                    await result.consume()
+                except Exception as e:
+                    logger.warning(
+                        f"Skipping Neo4j schema statement {statement!r}: {e}"
+                    )
+
+    async def close(self) -> None:
         """Close the Neo4j driver connection."""
         if self._driver is not None:
-            self._driver.close()
+            await self._driver.close()
             self._driver = None
 
-    @contextmanager
-    def session(self, **kwargs) -> Session:
-        """Context manager for Neo4j session."""
+    @asynccontextmanager
+    async def session(self, **kwargs) -> AsyncIterator[AsyncSession]:
+        """Async context manager for Neo4j session.
+
+        Nested calls made while a session is already open in the current
+        context reuse that session instead of opening a new one, so several
+        queries issued for one command share a single session. Passing session
+        kwargs always opens a fresh session.
+
+        Sessions are pinned to the configured database and default to read
+        access, since every query helper only reads; on a cluster this routes
+        them to followers/read replicas.
+        """
+        active = self._active_session.get()
+        if active is not None and not kwargs:
+            yield active[0]
+            return
+
+        async with self._open_session(**kwargs) as session:
+            token = self._active_session.set((session, kwargs))
+            try:
+                yield session
+            finally:
+                self._active_session.reset(token)
+
+    @asynccontextmanager
+    async def _open_session(self, **kwargs) -> AsyncIterator[AsyncSession]:
+        """Open a session on the configured database without publishing it."""
         if self._driver is None:
-            self.connect()
+            await self.connect()
 
         assert self._driver is not None  # for type checkers
+        kwargs.setdefault("default_access_mode", READ_ACCESS)
         session = self._driver.session(database=self.config.neo4j_database, **kwargs)
         try:
             yield session
         finally:
-            session.close()
-
-    def verify_connectivity(self) -> bool:
+            await session.close()
+
+    async def iter_records(
+        self, cypher: str, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run a query and yield each record as a dict while the driver streams it.
+
+        The query gets a session of its own, opened with the same options as
+        the enclosing `session()` block, if any. The consumer may run other
+        queries between records, and those must not land on a session whose
+        result is still streaming. The session stays open until the iterator is
+        exhausted or closed.
+        """
+        active = self._active_session.get()
+        kwargs = dict(active[1]) if active is not None else {}
+        async with self._open_session(**kwargs) as session:
+            result = await session.run(cypher, params)
+            async for record in result:
+                yield record.data()
+
+    async def verify_connectivity(self) -> bool:
         """Verify connection to Neo4j database."""
         try:
             if self._driver is None:
-                self.connect()
+                await self.connect()
             assert self._driver is not None
-            self._driver.verify_connectivity()
+            await self._driver.verify_connectivity()
             return True
         except Exception as e:
             logger.error("Neo4j connectivity check failed: %s", e, exc_info=True)
             return False
 
-    def __enter__(self) -> "Neo4jClient":
-        """Context manager entry."""
-        self.connect()
+    async def __aenter__(self) -> "Neo4jClient":
+        """Async context manager entry."""
+        await self.connect()
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Context manager exit."""
-        self.close()
-
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
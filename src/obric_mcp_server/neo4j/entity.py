@@ -13,18 +13,96 @@ managed by the caller. It does NOT create or manage connections,
 only uses the provided client to open sessions.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from neo4j import Result
+from neo4j import AsyncResult
 
+from ._cache import ResultCache, replay
+from ._match import build_entity_match, compiled_match, norm_lower
 from .client import Neo4jClient
+from .schema import RELATIONSHIP_EMBEDDING_INDEX
 
+# Id lookups return at most one node; the query text never varies.
+_FIND_ENTITY_BY_ID = f"""
+{compiled_match("n", "id")}
+RETURN properties(n) AS node
+LIMIT 1
+"""
+
+# Entities around the matched RelationshipDetails `rd` (source -> rd -> target),
+# keyed by direction: "outbound" keeps the sources, "inbound" the targets and
+# None both. Each variant is a single directed MATCH.
+_ENTITIES_AROUND_RELATIONSHIP: Dict[Optional[str], str] = {
+    None: """
+MATCH (src:Entity)-[]->(rd)-[]->(dst:Entity)
+UNWIND [src, dst] AS entity
+WITH DISTINCT entity
+RETURN properties(entity) AS entity
+LIMIT $limit
+""",
+    "outbound": """
+MATCH (entity:Entity)-[]->(rd)-[]->(:Entity)
+WITH DISTINCT entity
+RETURN properties(entity) AS entity
+LIMIT $limit
+""",
+    "inbound": """
+MATCH (:Entity)-[]->(rd)-[]->(entity:Entity)
+WITH DISTINCT entity
+RETURN properties(entity) AS entity
+LIMIT $limit
+""",
+}
+
+# RelationshipDetails whose description or type contains the lower-cased $query.
+_RELATIONSHIP_QUERY_MATCH = """
+MATCH (rd:RelationshipDetail)
+WHERE toLower(rd.description) CONTAINS $query
+   OR toLower(rd.relationship_type) CONTAINS $query
+"""
+
+# RelationshipDetails whose embedding is similar enough to $embedding.
+_RELATIONSHIP_EMBEDDING_MATCH = """
+MATCH (rd:RelationshipDetail)
+WHERE rd.embedding IS NOT NULL
+WITH rd, gds.similarity.cosine(rd.embedding, $embedding) AS similarity
+WHERE similarity >= $threshold
+"""
+
+# RelationshipDetails near $embedding according to the vector index: the
+# $k nearest ones, kept if their index score reaches $min_score.
+_RELATIONSHIP_VECTOR_MATCH = f"""
+CALL db.index.vector.queryNodes('{RELATIONSHIP_EMBEDDING_INDEX}', $k, $embedding)
+YIELD node AS rd, score
+WHERE score >= $min_score
+"""
+
+# Full query text per direction, built once so every call sends identical text.
+_ENTITIES_BY_RELATIONSHIP_QUERY: Dict[Optional[str], str] = {
+    direction: _RELATIONSHIP_QUERY_MATCH + around
+    for direction, around in _ENTITIES_AROUND_RELATIONSHIP.items()
+}
+_ENTITIES_BY_RELATIONSHIP_EMBEDDING: Dict[Optional[str], str] = {
+    direction: _RELATIONSHIP_EMBEDDING_MATCH + around
+    for direction, around in _ENTITIES_AROUND_RELATIONSHIP.items()
+}
+_ENTITIES_BY_RELATIONSHIP_VECTOR: Dict[Optional[str], str] = {
+    direction: _RELATIONSHIP_VECTOR_MATCH + around
+    for direction, around in _ENTITIES_AROUND_RELATIONSHIP.items()
+}
 
 class EntityDB:
     """Low-level Neo4j entity query helpers backed by a Neo4jClient."""
 
+    # Results of repeated lookups are reused for a short while.
+    RESULT_CACHE_MAXSIZE = 10_000
+    RESULT_CACHE_TTL_SECONDS = 60
+
     def __init__(self, client: Neo4jClient) -> None:
         self.client = client
+        self._results = ResultCache(
+            maxsize=self.RESULT_CACHE_MAXSIZE, ttl=self.RESULT_CACHE_TTL_SECONDS
+        )
 
     @staticmethod
     def _norm(value: Optional[str]) -> Optional[str]:
@@ -42,72 +120,22 @@ class EntityDB:
         ticker: Optional[str] = None,
         short_name: Optional[str] = None,
         legal_name: Optional[str] = None,
+        param_prefix: str = "",
     ) -> tuple[str, Dict[str, Any]]:
-        """Build MATCH/WHERE clause for entity identification (EntityDB version).
+        """Build MATCH/WHERE clause for entity identification.
 
-        Priority:
-        1. Internal Neo4j node id (exact match)
-        2. Ticker (case-insensitive exact match)
-        3. Short name / legal name (fuzzy CONTAINS search)
+        See `build_entity_match` for the lookup priority.
         """
-        # Normalize inputs
-        ticker = self._norm(ticker)
-        short_name = self._norm(short_name)
-        legal_name = self._norm(legal_name)
-
-        params: Dict[str, Any] = {}
-
-        # 1) Highest priority: internal Neo4j id
-        if id is not None:
-            match_clause = f"MATCH ({entity_var}) WHERE {entity_var}.id = $id"
-            params["id"] = id
-
-        # 2) Second priority: ticker (exact, case-insensitive match)
-        elif ticker is not None:
-            match_clause = (
-                f"MATCH ({entity_var}:Entity) "
-                f"WHERE toLower({entity_var}.ticker) = toLower($ticker)"
-            )
-            params["ticker"] = ticker
-
-        # 3) Fallback: short_name / legal_name fuzzy search
-        else:
-            if short_name is None and legal_name is None:
-                raise ValueError(
-                    "At least one of short_name or legal_name must be provided "
-                    "when id and ticker are not given."
-                )
-
-            where_clauses: List[str] = []
-
-            if short_name is not None:
-                params["short_name"] = short_name
-                where_clauses.append(
-                    f"""
-                    (toLower({entity_var}.short_name) CONTAINS toLower($short_name)
-                     OR toLower({entity_var}.legal_name) CONTAINS toLower($short_name))
-                    """
-                )
-
-            if legal_name is not None:
-                params["legal_name"] = legal_name
-                where_clauses.append(
-                    f"""
-                    (toLower({entity_var}.short_name) CONTAINS toLower($legal_name)
-                     OR toLower({entity_var}.legal_name) CONTAINS toLower($legal_name))
-                    """
-                )
-
-            where_combined = " OR ".join(f"({wc.strip()})" for wc in where_clauses)
-
-            match_clause = f"""
-            MATCH ({entity_var}:Entity)
-            WHERE {where_combined}
-            """
-
-        return match_clause.strip(), params
+        return build_entity_match(
+            entity_var=entity_var,
+            id=id,
+            ticker=ticker,
+            short_name=short_name,
+            legal_name=legal_name,
+            param_prefix=param_prefix,
+        )
 
-    def find_entity(
+    async def find_entity(
         self,
         *,
         id: Optional[str] = None,
@@ -135,36 +163,138 @@ class EntityDB:
             List of records as dictionaries, each containing:
                 {<Neo4j node>}
         """
-
-        match_clause, params = self._build_entity_match(
-            entity_var="n",
+        records = self.iter_entity(
             id=id,
             ticker=ticker,
             short_name=short_name,
             legal_name=legal_name,
+            limit=limit,
         )
+        return [record async for record in records]
+
+    def iter_entity(
+        self,
+        *,
+        id: Optional[str] = None,
+        ticker: Optional[str] = None,
+        short_name: Optional[str] = None,
+        legal_name: Optional[str] = None,
+        limit: int = 1,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield entity records as the driver streams them.
 
-        # For id-based queries, use LIMIT 1; for others use $limit
+        Same arguments and record shape as `find_entity`. Inputs are validated
+        and the query is built eagerly; the session stays open until the
+        returned iterator is exhausted or closed.
+
+        Fully read results are cached for `RESULT_CACHE_TTL_SECONDS`, keyed by
+        the normalized identifiers; a cache hit opens no session.
+        """
+        # Fast path: id lookups are the common case and always the same query.
         if id is not None:
-            cypher = f"""
-            {match_clause}
-            RETURN n AS node
-            LIMIT 1
-            """
+            key: tuple = ("entity", id)
+            cypher = _FIND_ENTITY_BY_ID
+            params: Dict[str, Any] = {"id": id}
         else:
+            match_clause, params = self._build_entity_match(
+                entity_var="n",
+                ticker=ticker,
+                short_name=short_name,
+                legal_name=legal_name,
+            )
+            key = (
+                "entity",
+                None,
+                norm_lower(ticker),
+                norm_lower(short_name),
+                norm_lower(legal_name),
+                limit,
+            )
             params["limit"] = limit
             cypher = f"""
             {match_clause}
-            RETURN n AS node
+            RETURN properties(n) AS node
             LIMIT $limit
             """
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-            return [record["node"] for record in records]
+        cached = self._results.get(key)
+        if cached is not None:
+            return replay(cached)
+
+        return self._results.stream(
+            key,
+            (
+                record["node"]
+                async for record in self.client.iter_records(cypher, params)
+            ),
+        )
+
+    async def find_entities_by_ids(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up many entities by id in a single query.
+
+        Args:
+            ids: Entity ids to look up. Duplicates are queried once.
+
+        Returns:
+            Mapping of each id that was found to its entity properties. Ids with
+            no matching entity are absent.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return {}
+
+        cypher = """
+        UNWIND $ids AS id
+        MATCH (n:Entity)
+        WHERE n.id = id
+        RETURN id, properties(n) AS node
+        """
+
+        return {
+            record["id"]: record["node"]
+            async for record in self.client.iter_records(cypher, {"ids": unique_ids})
+        }
+
+    async def find_entities_by_tickers(
+        self, tickers: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Look up many entities by ticker (case-insensitive) in a single query.
+
+        Args:
+            tickers: Ticker symbols to look up. Blank tickers are ignored, and
+                tickers differing only in case or surrounding whitespace are
+                queried once.
+
+        Returns:
+            Mapping of each input ticker that was found to its entity
+            properties. When several entities share a ticker, the one with the
+            smallest id is returned.
+        """
+        by_lower: Dict[str, List[str]] = {}
+        for ticker in tickers:
+            lowered = norm_lower(ticker)
+            if lowered is not None:
+                by_lower.setdefault(lowered, []).append(ticker)
+        if not by_lower:
+            return {}
+
+        cypher = """
+        UNWIND $tickers AS ticker
+        MATCH (n:Entity)
+        WHERE toLower(n.ticker) = ticker
+        WITH ticker, n
+        ORDER BY n.id
+        RETURN ticker, collect(properties(n))[0] AS node
+        """
+
+        found: Dict[str, Dict[str, Any]] = {}
+        params = {"tickers": list(by_lower)}
+        async for record in self.client.iter_records(cypher, params):
+            for ticker in by_lower[record["ticker"]]:
+                found[ticker] = record["node"]
+        return found
 
-    def query_entity(
+    async def query_entity(
         self,
         *,
         query: str,
@@ -190,23 +320,30 @@ class EntityDB:
         if not query_str:
             raise ValueError("query must be a non-empty string")
 
+        key = ("query_entity", query_str.lower(), limit)
+        cached = self._results.get(key)
+        if cached is not None:
+            return cached
+
         cypher = """
         MATCH (n:Entity)
-        WHERE toLower(n.ticker) CONTAINS toLower($query)
-           OR toLower(n.entity_type) CONTAINS toLower($query)
-           OR toLower(n.short_name) CONTAINS toLower($query)
-           OR toLower(n.legal_name) CONTAINS toLower($query)
-        RETURN n AS node
+        WHERE toLower(n.ticker) CONTAINS $query
+           OR toLower(n.entity_type) CONTAINS $query
+           OR toLower(n.short_name) CONTAINS $query
+           OR toLower(n.legal_name) CONTAINS $query
+        RETURN properties(n) AS node
         LIMIT $limit
         """
-        params: Dict[str, Any] = {"query": query_str, "limit": limit}
+        # Lower-cased once here rather than per row and field in the query.
+        params: Dict[str, Any] = {"query": query_str.lower(), "limit": limit}
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-            return [record["node"] for record in records]
+        async with self.client.session() as session:
+            result: AsyncResult = await session.run(cypher, params)
+            entities = [record["node"] async for record in result]
+        self._results.put(key, entities)
+        return entities
 
-    def find_entity_by_relationship_query(
+    async def find_entity_by_relationship_query(
         self,
         *,
         query: str,
@@ -238,51 +375,21 @@ class EntityDB:
         if direction is not None and direction not in {"inbound", "outbound"}:
             raise ValueError('direction must be None, "inbound", or "outbound"')
 
-        params: Dict[str, Any] = {"query": query_str, "limit": limit, "direction": direction}
-
-        
-        # Query for RelationshipDetails matching the query, then get connected entities
-        # Match RelationshipDetails once, collect entities from both directions per RD, then unwind
-        cypher = """
-        MATCH (rd:RelationshipDetail)
-        WHERE (rd.description IS NOT NULL AND toLower(rd.description) CONTAINS toLower($query))
-        OR (rd.relationship_type IS NOT NULL AND toLower(rd.relationship_type) CONTAINS toLower($query))
+        key = ("find_entity_by_relationship_query", query_str.lower(), direction, limit)
+        cached = self._results.get(key)
+        if cached is not None:
+            return cached
 
-        // 2) Match both orientations around rd
-        OPTIONAL MATCH (src1:Entity)-[]->(rd)-[]->(dst1:Entity)
-        OPTIONAL MATCH (dst2:Entity)<-[]-(rd)<-[]-(src2:Entity)
-        """
-
-        if direction is None:
-            cypher += """
-            WITH [src1, dst1, src2, dst2] as entities
-            """
-        elif direction == "outbound":
-            cypher += """
-            WITH [src1, src2] as entities
-            """
-
-        elif direction == "inbound":
-            cypher += """
-            WITH [dst1, dst2] as entities
-            """
-
-        cypher += """
-        UNWIND entities AS entity
-        RETURN DISTINCT entity
-        LIMIT $limit;
-        """
+        cypher = _ENTITIES_BY_RELATIONSHIP_QUERY[direction]
+        params: Dict[str, Any] = {"query": query_str.lower(), "limit": limit}
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-            
-        # Merge entity properties with relationship_direction
-        return [
-            {**record["entity"]} for record in records
-        ]
+        async with self.client.session() as session:
+            result: AsyncResult = await session.run(cypher, params)
+            entities = [record["entity"] async for record in result]
+        self._results.put(key, entities)
+        return entities
 
-    def find_entity_by_relationship_embedding(
+    async def find_entity_by_relationship_embedding(
         self,
         *,
         embedding: List[float],
@@ -310,6 +417,33 @@ class EntityDB:
 
         Raises:
             ValueError: If embedding is empty or direction is invalid.
+
+        With `NEO4J_USE_VECTOR_INDEX` set, candidates come from the
+        RelationshipDetail vector index (approximate nearest neighbours, at most
+        ``max(4 * limit, 100)`` details) instead of scoring every node with GDS.
+        """
+        records = self.iter_entity_by_relationship_embedding(
+            embedding=embedding,
+            threshold=threshold,
+            direction=direction,
+            limit=limit,
+        )
+        return [record async for record in records]
+
+    def iter_entity_by_relationship_embedding(
+        self,
+        *,
+        embedding: List[float],
+        threshold: float = 0.7,
+        direction: Optional[str] = None,
+        limit: int = 250,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield matching entity records as the driver streams them.
+
+        Same arguments and record shape as
+        `find_entity_by_relationship_embedding`. Inputs are validated and the
+        query is built eagerly; the session stays open until the returned
+        iterator is exhausted or closed.
         """
         if not embedding:
             raise ValueError("embedding must be a non-empty list")
@@ -320,55 +454,31 @@ class EntityDB:
         if direction is not None and direction not in {"inbound", "outbound"}:
             raise ValueError('direction must be None, "inbound", or "outbound"')
 
-        params: Dict[str, Any] = {
-            "embedding": embedding,
-            "threshold": threshold,
-            "limit": limit,
-            "direction": direction,
-        }
-
-        # Query for RelationshipDetails matching the embedding similarity, then get connected entities
-        # Match RelationshipDetails once, collect entities from both directions per RD, then unwind
-        cypher = """
-        MATCH (rd:RelationshipDetail)
-        WHERE rd.embedding IS NOT NULL
-        WITH rd, gds.similarity.cosine(rd.embedding, $embedding) AS similarity
-        WHERE similarity >= $threshold
-
-        // 2) Match both orientations around rd
-        OPTIONAL MATCH (src1:Entity)-[]->(rd)-[]->(dst1:Entity)
-        OPTIONAL MATCH (dst2:Entity)<-[]-(rd)<-[]-(src2:Entity)
-        """
-
-        if direction is None:
-            cypher += """
-            WITH [src1, dst1, src2, dst2] as entities
-            """
-        elif direction == "outbound":
-            cypher += """
-            WITH [src1, src2] as entities
-            """
-        elif direction == "inbound":
-            cypher += """
-            WITH [dst1, dst2] as entities
-            """
-
-        cypher += """
-        UNWIND entities AS entity
-        RETURN DISTINCT entity
-        LIMIT $limit;
-        """
-
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-
-        # Merge entity properties
-        return [
-            {**record["entity"]} for record in records
-        ]
+        if self.client.config.neo4j_use_vector_index:
+            cypher = _ENTITIES_BY_RELATIONSHIP_VECTOR[direction]
+            params: Dict[str, Any] = {
+                "embedding": embedding,
+                # Over-fetch: each detail yields up to two entities, and the
+                # direction filter drops some of them.
+                "k": max(limit * 4, 100),
+                # The index scores cosine similarity as (1 + cos) / 2.
+                "min_score": (1 + threshold) / 2,
+                "limit": limit,
+            }
+        else:
+            cypher = _ENTITIES_BY_RELATIONSHIP_EMBEDDING[direction]
+            params = {
+                "embedding": embedding,
+                "threshold": threshold,
+                "limit": limit,
+            }
+
+        return (
+            record["entity"]
+            async for record in self.client.iter_records(cypher, params)
+        )
 
-    def find_affiliate_entities(
+    async def find_affiliate_entities(
         self,
         *,
         id: Optional[str] = None,
@@ -396,6 +506,30 @@ class EntityDB:
         Raises:
             ValueError: If entity identification fails.
         """
+        records = self.iter_affiliate_entities(
+            id=id,
+            ticker=ticker,
+            short_name=short_name,
+            legal_name=legal_name,
+            limit=limit,
+        )
+        return [record async for record in records]
+
+    def iter_affiliate_entities(
+        self,
+        *,
+        id: Optional[str] = None,
+        ticker: Optional[str] = None,
+        short_name: Optional[str] = None,
+        legal_name: Optional[str] = None,
+        limit: int = 250,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield affiliate entity records as the driver streams them.
+
+        Same arguments and record shape as `find_affiliate_entities`. Inputs are
+        validated and the query is built eagerly; the session stays open until
+        the returned iterator is exhausted or closed.
+        """
         # Build match clause for the starting entity
         match_clause, match_params = self._build_entity_match(
             entity_var="start",
@@ -424,15 +558,12 @@ class EntityDB:
           AND other.entity_type = "company"
           AND start.entity_type = "company"
         WITH DISTINCT other AS entity, collect(DISTINCT rd.relationship_type) AS relationship_types
-        RETURN entity, relationship_types[0] AS relationship_type
+        RETURN properties(entity) AS entity, relationship_types[0] AS relationship_type
         LIMIT $limit
         """
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-
-        return [
-            {**record["entity"], "relationship_type": record["relationship_type"]} for record in records
-        ]
+        return (
+            {**record["entity"], "relationship_type": record["relationship_type"]}
+            async for record in self.client.iter_records(cypher, params)
+        )
 
@@ -4,26 +4,25 @@ This module provides the `NeighbourhoodDB` class for querying entity neighbourho
 and related graph structures.
 """
 
-from typing import Any, Dict, List, Optional
-
-from neo4j import Result
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+from ._cache import ResultCache
+from ._match import build_entity_match, norm_lower
 from .client import Neo4jClient
 
 # TODO: we may need to get all Tier 1 enitites and relationship details for better exposure.
 class NeighbourhoodDB:
     """Low-level Neo4j neighbourhood query helpers backed by a Neo4jClient."""
 
+    # Results of repeated lookups are reused for a short while.
+    RESULT_CACHE_MAXSIZE = 10_000
+    RESULT_CACHE_TTL_SECONDS = 60
+
     def __init__(self, client: Neo4jClient) -> None:
         self.client = client
-
-    @staticmethod
-    def _norm(value: Optional[str]) -> Optional[str]:
-        """Normalize string inputs: strip whitespace, treat empty as None."""
-        if value is None:
-            return None
-        v = value.strip()
-        return v if v else None
+        self._results = ResultCache(
+            maxsize=self.RESULT_CACHE_MAXSIZE, ttl=self.RESULT_CACHE_TTL_SECONDS
+        )
 
     def _build_entity_match(
         self,
@@ -33,72 +32,22 @@ class NeighbourhoodDB:
         ticker: Optional[str] = None,
         short_name: Optional[str] = None,
         legal_name: Optional[str] = None,
+        param_prefix: str = "",
     ) -> tuple[str, Dict[str, Any]]:
         """Build MATCH/WHERE clause for entity identification.
 
-        Priority:
-        1. Internal Neo4j node id (exact match)
-        2. Ticker (case-insensitive exact match)
-        3. Short name / legal name (fuzzy CONTAINS search)
+        See `build_entity_match` for the lookup priority.
         """
-        # Normalize inputs
-        ticker = self._norm(ticker)
-        short_name = self._norm(short_name)
-        legal_name = self._norm(legal_name)
-
-        params: Dict[str, Any] = {}
-
-        # 1) Highest priority: internal Neo4j id
-        if id is not None:
-            match_clause = f"MATCH ({entity_var}) WHERE {entity_var}.id = $id"
-            params["id"] = id
-
-        # 2) Second priority: ticker (exact, case-insensitive match)
-        elif ticker is not None:
-            match_clause = (
-                f"MATCH ({entity_var}:Entity) "
-                f"WHERE toLower({entity_var}.ticker) = toLower($ticker)"
-            )
-            params["ticker"] = ticker
-
-        # 3) Fallback: short_name / legal_name fuzzy search
-        else:
-            if short_name is None and legal_name is None:
-                raise ValueError(
-                    "At least one of short_name or legal_name must be provided "
-                    "when id and ticker are not given."
-                )
-
-            where_clauses: List[str] = []
-
-            if short_name is not None:
-                params["short_name"] = short_name
-                where_clauses.append(
-                    f"""
-                    (toLower({entity_var}.short_name) CONTAINS toLower($short_name)
-                     OR toLower({entity_var}.legal_name) CONTAINS toLower($short_name))
-                    """
-                )
-
-            if legal_name is not None:
-                params["legal_name"] = legal_name
-                where_clauses.append(
-                    f"""
-                    (toLower({entity_var}.short_name) CONTAINS toLower($legal_name)
-                     OR toLower({entity_var}.legal_name) CONTAINS toLower($legal_name))
-                    """
-                )
-
-            where_combined = " OR ".join(f"({wc.strip()})" for wc in where_clauses)
-
-            match_clause = f"""
-            MATCH ({entity_var}:Entity)
-            WHERE {where_combined}
-            """
-
-        return match_clause.strip(), params
-
-    def find_connected_entities(
+        return build_entity_match(
+            entity_var=entity_var,
+            id=id,
+            ticker=ticker,
+            short_name=short_name,
+            legal_name=legal_name,
+            param_prefix=param_prefix,
+        )
+
+    async def find_connected_entities(
         self,
         *,
         id: Optional[str] = None,
@@ -130,6 +79,56 @@ class NeighbourhoodDB:
 
         Raises:
             ValueError: If tier values are invalid or direction is invalid.
+
+        Results are cached for `RESULT_CACHE_TTL_SECONDS`, keyed by the
+        normalized arguments.
+        """
+        key = (
+            "find_connected_entities",
+            id,
+            norm_lower(ticker),
+            norm_lower(short_name),
+            norm_lower(legal_name),
+            min_tier,
+            max_tier,
+            direction,
+            limit,
+        )
+        cached = self._results.get(key)
+        if cached is not None:
+            return cached
+
+        records = self.iter_connected_entities(
+            id=id,
+            ticker=ticker,
+            short_name=short_name,
+            legal_name=legal_name,
+            min_tier=min_tier,
+            max_tier=max_tier,
+            direction=direction,
+            limit=limit,
+        )
+        entities = [record async for record in records]
+        self._results.put(key, entities)
+        return entities
+
+    def iter_connected_entities(
+        self,
+        *,
+        id: Optional[str] = None,
+        ticker: Optional[str] = None,
+        short_name: Optional[str] = None,
+        legal_name: Optional[str] = None,
+        min_tier: int = 1,
+        max_tier: int = 1,
+        direction: Optional[str] = None,
+        limit: int = 250,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield connected entity records as the driver streams them.
+
+        Same arguments and record shape as `find_connected_entities`. Inputs are
+        validated and the query is built eagerly; the session stays open until
+        the returned iterator is exhausted or closed.
         """
         if min_tier < 0:
             raise ValueError("min_tier must be >= 0")
@@ -152,13 +151,18 @@ class NeighbourhoodDB:
         params["maxTier"] = max_tier
         params["limit"] = limit
 
+        # Variable-length bounds can't be Cypher parameters, so the hop count is
+        # the only value formatted into the query text. Coerce it to int so the
+        # text is canonical per tier and the server's plan cache is reused.
+        max_hops = 2 * int(max_tier)
+
         # Determine relationship pattern based on direction
         if direction == "outbound":
-            rel_pattern = f"(start)-[r*1..{2*max_tier}]->(e:Entity)"
+            rel_pattern = f"(start)-[r*1..{max_hops}]->(e:Entity)"
         elif direction == "inbound":
-            rel_pattern = f"(start)<-[r*1..{2*max_tier}]-(e:Entity)"
+            rel_pattern = f"(start)<-[r*1..{max_hops}]-(e:Entity)"
         else:  # direction is None - both directions
-            rel_pattern = f"(start)-[r*1..{2*max_tier}]-(e:Entity)"
+            rel_pattern = f"(start)-[r*1..{max_hops}]-(e:Entity)"
 
         cypher = f"""
         {start_match}
@@ -173,17 +177,17 @@ class NeighbourhoodDB:
                 (i % 2 = 0 AND 'Entity' IN labels(nodes(path)[i])) OR
                 (i % 2 = 1 AND 'RelationshipDetail' IN labels(nodes(path)[i]))
           )
-        WITH e, path,
-             size([n IN nodes(path) WHERE 'Entity' IN labels(n)]) - 1 AS tier
+        // Nodes alternate Entity/RelationshipDetail, so each tier is two hops.
+        WITH e, length(path) / 2 AS tier
         WHERE tier >= $minTier AND tier <= $maxTier
-        RETURN DISTINCT e AS entity, tier
+        WITH DISTINCT e, tier
+        RETURN properties(e) AS entity, tier
         ORDER BY tier
         LIMIT $limit
         """
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-
-        return [{**record["entity"], "tier": record["tier"]} for record in records]
+        return (
+            {**record["entity"], "tier": record["tier"]}
+            async for record in self.client.iter_records(cypher, params)
+        )
 
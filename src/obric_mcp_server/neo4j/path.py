@@ -5,24 +5,15 @@ This module is intentionally minimal for now and only provides the
 here as needed.
 """
 
-from typing import Any, Dict, List, Optional
-
-from neo4j import Result
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+from ._match import build_entity_match
 from .client import Neo4jClient
 
 class PathDB:
-    def __init__(self, client: Optional[Neo4jClient] = None) -> None:
+    def __init__(self, client: Neo4jClient) -> None:
         self.client = client
 
-    @staticmethod
-    def _norm(value: Optional[str]) -> Optional[str]:
-        """Normalize string inputs: strip whitespace, treat empty as None."""
-        if value is None:
-            return None
-        v = value.strip()
-        return v if v else None
-
     def _build_entity_match(
         self,
         *,
@@ -31,73 +22,22 @@ class PathDB:
         ticker: Optional[str] = None,
         short_name: Optional[str] = None,
         legal_name: Optional[str] = None,
+        param_prefix: str = "",
     ) -> tuple[str, Dict[str, Any]]:
         """Build MATCH/WHERE clause for entity identification.
 
-        Priority:
-        1. Internal Neo4j node id (exact match)
-        2. Ticker (case-insensitive exact match)
-        3. Short name / legal name (fuzzy "LIKE" search using CONTAINS)
+        See `build_entity_match` for the lookup priority.
         """
-        # Normalize inputs
-        ticker = self._norm(ticker)
-        short_name = self._norm(short_name)
-        legal_name = self._norm(legal_name)
-
-        params: Dict[str, Any] = {}
-
-        # 1) Highest priority: internal Neo4j id
-        if id is not None:
-            match_clause = f"MATCH ({entity_var}) WHERE {entity_var}.id = $id"
-            params["id"] = id
-
-        # 2) Second priority: ticker (exact, case-insensitive match)
-        elif ticker is not None:
-            match_clause = (
-                f"MATCH ({entity_var}:Entity) "
-                f"WHERE toLower({entity_var}.ticker) = toLower($ticker)"
-            )
-            params["ticker"] = ticker
-
-        # 3) Fallback: short_name / legal_name fuzzy search
-        else:
-            if short_name is None and legal_name is None:
-                raise ValueError(
-                    "At least one of short_name or legal_name must be provided "
-                    "when id and ticker are not given."
-                )
-
-            where_clauses: List[str] = []
-
-            if short_name is not None:
-                params["short_name"] = short_name
-                where_clauses.append(
-                    f"""
-                    (toLower({entity_var}.short_name) CONTAINS toLower($short_name)
-                     OR toLower({entity_var}.legal_name) CONTAINS toLower($short_name))
-                    """
-                )
-
-            if legal_name is not None:
-                params["legal_name"] = legal_name
-                where_clauses.append(
-                    f"""
-                    (toLower({entity_var}.short_name) CONTAINS toLower($legal_name)
-                     OR toLower({entity_var}.legal_name) CONTAINS toLower($legal_name))
-                    """
-                )
-
-            # Combine all provided name-based conditions with OR
-            where_combined = " OR ".join(f"({wc.strip()})" for wc in where_clauses)
-
-            match_clause = f"""
-            MATCH ({entity_var}:Entity)
-            WHERE {where_combined}
-            """
-
-        return match_clause.strip(), params
-
-    def find_paths_between_entities(
+        return build_entity_match(
+            entity_var=entity_var,
+            id=id,
+            ticker=ticker,
+            short_name=short_name,
+            legal_name=legal_name,
+            param_prefix=param_prefix,
+        )
+
+    async def find_paths_between_entities(
         self,
         *,
         id1: Optional[str] = None,
@@ -131,6 +71,42 @@ class PathDB:
 
             Entity0 -> RelationshipDetail -> Entity1 -> ... -> EntityN
         """
+        paths = self.iter_paths_between_entities(
+            id1=id1,
+            ticker1=ticker1,
+            short_name1=short_name1,
+            legal_name1=legal_name1,
+            id2=id2,
+            ticker2=ticker2,
+            short_name2=short_name2,
+            legal_name2=legal_name2,
+            direction=direction,
+            max_tier=max_tier,
+            max_paths=max_paths,
+        )
+        return [path async for path in paths]
+
+    def iter_paths_between_entities(
+        self,
+        *,
+        id1: Optional[str] = None,
+        ticker1: Optional[str] = None,
+        short_name1: Optional[str] = None,
+        legal_name1: Optional[str] = None,
+        id2: Optional[str] = None,
+        ticker2: Optional[str] = None,
+        short_name2: Optional[str] = None,
+        legal_name2: Optional[str] = None,
+        direction: Optional[str] = "outbound",
+        max_tier: int = 10,
+        max_paths: int = 100,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Lazily yield paths between two entities as the driver streams them.
+
+        Same arguments and path shape as `find_paths_between_entities`. Inputs
+        are validated and the query is built eagerly; the session stays open
+        until the returned iterator is exhausted or closed.
+        """
         if direction is not None and direction not in {"outbound", "inbound"}:
             raise ValueError('direction must be None, "outbound", or "inbound"')
         if max_tier < 1:
@@ -145,6 +121,7 @@ class PathDB:
             ticker=ticker1,
             short_name=short_name1,
             legal_name=legal_name1,
+            param_prefix="e1_",
         )
 
         # Build entity2 match clause
@@ -154,30 +131,25 @@ class PathDB:
             ticker=ticker2,
             short_name=short_name2,
             legal_name=legal_name2,
+            param_prefix="e2_",
         )
 
-        # Merge params with simple prefixes to avoid conflicts
-        params: Dict[str, Any] = {}
-        for key, value in params1.items():
-            params[f"1_{key}"] = value
-            e1_match = e1_match.replace(f"${key}", f"$1_{key}")
-        for key, value in params2.items():
-            params[f"2_{key}"] = value
-            e2_match = e2_match.replace(f"${key}", f"$2_{key}")
+        params: Dict[str, Any] = {**params1, **params2, "max_paths": max_paths}
 
-        params["max_paths"] = max_paths
-
-        # Path pattern based on direction (max_tier entity hops ≈ max_tier*2 rel hops)
+        # Path pattern based on direction (max_tier entity hops ≈ max_tier*2 rel hops).
+        # Variable-length bounds can't be Cypher parameters; coerce to int so the
+        # query text is canonical per tier and the server's plan cache is reused.
+        max_hops = int(max_tier) * 2
         if direction == "outbound":
-            rel_pattern = f"-[*1..{max_tier*2}]->"
+            rel_pattern = f"-[*1..{max_hops}]->"
             direction_key1 = "from"
             direction_key2 = "to"
         elif direction == "inbound":
-            rel_pattern = f"<-[*1..{max_tier*2}]-"
+            rel_pattern = f"<-[*1..{max_hops}]-"
             direction_key1 = "to"
             direction_key2 = "from"
         else:  # direction is None - bidirectional
-            rel_pattern = f"-[*1..{max_tier*2}]-"
+            rel_pattern = f"-[*1..{max_hops}]-"
             direction_key1 = "from"
             direction_key2 = "to"
 
@@ -193,22 +165,18 @@ class PathDB:
         WITH nodes(path) AS ns
         WITH [i IN range(0, size(ns) - 3, 2) |
               {{
-                {direction_key1}: ns[i],
+                {direction_key1}: properties(ns[i]),
                 relationship_detail: {{id: ns[i + 1].id, description: ns[i + 1].description, relationship_type: ns[i + 1].relationship_type, source_url: ns[i + 1].source_url, created_at: ns[i + 1].created_at}},
-                {direction_key2}: ns[i + 2]
+                {direction_key2}: properties(ns[i + 2])
               }}] AS segments
         RETURN segments AS path
         LIMIT $max_paths
         """
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-
         # Each record["path"] is a list of segments (from, relationship_detail, to)
         # For inbound, reverse the segments to maintain consistent ordering
+        records = self.client.iter_records(cypher, params)
+        paths = (record["path"] async for record in records)
         if direction == "inbound":
-            return [record["path"][::-1] for record in records]
-        else:
-            return [record["path"] for record in records]
-
+            return (path[::-1] async for path in paths)
+        return paths
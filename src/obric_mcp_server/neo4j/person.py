@@ -9,9 +9,9 @@ Higher-level logic that composes these queries should live in the
 `tools` package.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from neo4j import Result
+from neo4j import AsyncResult
 
 from .client import Neo4jClient
 from .entity import EntityDB
@@ -110,7 +110,7 @@ class PersonDB:
 
         return match_clause, params
 
-    def query_person(
+    async def query_person(
         self,
         *,
         id: Optional[str] = None,
@@ -140,7 +140,7 @@ class PersonDB:
             cypher = """
             MATCH (p:Person)
             WHERE p.id = $id
-            RETURN p AS node
+            RETURN properties(p) AS node
             LIMIT 1
             """
             params: Dict[str, Any] = {"id": id}
@@ -154,18 +154,16 @@ class PersonDB:
             cypher = """
             MATCH (p:Person)
             WHERE toLower(p.full_name) CONTAINS toLower($name)
-            RETURN p AS node
+            RETURN properties(p) AS node
             LIMIT $limit
             """
             params = {"name": name_str, "limit": limit}
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
+        async with self.client.session() as session:
+            result: AsyncResult = await session.run(cypher, params)
+            return [record["node"] async for record in result]
 
-        return [record["node"] for record in records]
-
-    def find_people_by_entity(
+    async def find_people_by_entity(
         self,
         *,
         id: Optional[str] = None,
@@ -194,6 +192,30 @@ class PersonDB:
         Returns:
             List of distinct person nodes (as dictionaries).
         """
+        records = self.iter_people_by_entity(
+            id=id,
+            ticker=ticker,
+            short_name=short_name,
+            legal_name=legal_name,
+            limit=limit,
+        )
+        return [record async for record in records]
+
+    def iter_people_by_entity(
+        self,
+        *,
+        id: Optional[str] = None,
+        ticker: Optional[str] = None,
+        short_name: Optional[str] = None,
+        legal_name: Optional[str] = None,
+        limit: int = 250,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield person records as the driver streams them.
+
+        Same arguments and record shape as `find_people_by_entity`. Inputs are
+        validated and the query is built eagerly; the session stays open until
+        the returned iterator is exhausted or closed.
+        """
         # Reuse EntityDB's match-building logic to keep semantics consistent
         match_clause, params = self.entitydb._build_entity_match(
             entity_var="e",
@@ -208,14 +230,14 @@ class PersonDB:
         cypher = f"""
         {match_clause}
         MATCH (e)-[]-(rd:RelationshipDetail)-[]-(p:Person)
-        RETURN DISTINCT p AS person
+        WITH DISTINCT p
+        RETURN properties(p) AS person
         LIMIT $limit
         """
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-
-        return [record["person"] for record in records]
+        return (
+            record["person"]
+            async for record in self.client.iter_records(cypher, params)
+        )
 
 
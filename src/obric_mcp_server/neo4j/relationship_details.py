@@ -4,9 +4,9 @@ This module provides the `RelationshipDetailsDB` class for querying
 relationship details between entities.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from neo4j import Result
+from neo4j import AsyncResult
 
 from .client import Neo4jClient
 from .entity import EntityDB
@@ -32,7 +32,7 @@ class RelationshipDetailsDB:
         return v if v else None
 
 
-    def find_relationship_details(
+    async def find_relationship_details(
         self,
         *,
         id1: Optional[str] = None,
@@ -77,6 +77,7 @@ class RelationshipDetailsDB:
             ticker=ticker1,
             short_name=short_name1,
             legal_name=legal_name1,
+            param_prefix="e1_",
         )
 
         # Build entity2 match clause
@@ -86,17 +87,10 @@ class RelationshipDetailsDB:
             ticker=ticker2,
             short_name=short_name2,
             legal_name=legal_name2,
+            param_prefix="e2_",
         )
 
-        # Merge params, prefixing with numbers to avoid conflicts
-        params: Dict[str, Any] = {}
-        for key, value in params1.items():
-            params[f"1_{key}"] = value
-            e1_match = e1_match.replace(f"${key}", f"$1_{key}")
-        for key, value in params2.items():
-            params[f"2_{key}"] = value
-            e2_match = e2_match.replace(f"${key}", f"$2_{key}")
-        params["limit"] = limit
+        params: Dict[str, Any] = {**params1, **params2, "limit": limit}
 
         # Query for RelationshipDetails in both directions
         cypher = f"""
@@ -104,25 +98,26 @@ class RelationshipDetailsDB:
         WITH DISTINCT e1
         {e2_match}
         WITH DISTINCT e1, e2
-        OPTIONAL MATCH (e1)-[]->(rd_out:RelationshipDetail)-[]->(e2)
-        OPTIONAL MATCH (e1)<-[]-(rd_in:RelationshipDetail)<-[]-(e2)
-        WITH e1, e2, 
-             collect(DISTINCT {{rd: rd_out, dir: e1.short_name + " -> " + e2.short_name}}) AS outbound_rels,
-             collect(DISTINCT {{rd: rd_in, dir: e2.short_name + " -> " + e1.short_name}}) AS inbound_rels
-        UNWIND (outbound_rels + inbound_rels) AS rel
-        UNWIND rel.rd AS rd
+        CALL {{
+          WITH e1, e2
+          MATCH (e1)-[]->(rd:RelationshipDetail)-[]->(e2)
+          RETURN rd, e1.short_name + " -> " + e2.short_name AS relationship_direction
+          UNION
+          WITH e1, e2
+          MATCH (e1)<-[]-(rd:RelationshipDetail)<-[]-(e2)
+          RETURN rd, e2.short_name + " -> " + e1.short_name AS relationship_direction
+        }}
         RETURN rd.id as id, rd.description as description, rd.relationship_type as relationship_type, 
-        rd.source_url as source_url, rd.created_at as created_at, rel.dir as relationship_direction
+        rd.source_url as source_url, rd.created_at as created_at, relationship_direction
         ORDER BY rd.created_at DESC
         LIMIT $limit
         """
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-        return records
+        async with self.client.session() as session:
+            result: AsyncResult = await session.run(cypher, params)
+            return [record.data() async for record in result]
 
-    def find_government_awards(
+    async def find_government_awards(
         self,
         *,
         id: Optional[str] = None,
@@ -152,6 +147,30 @@ class RelationshipDetailsDB:
                     "awarded_from": <government agency name (short_name or legal_name)>
                 }
         """
+        records = self.iter_government_awards(
+            id=id,
+            ticker=ticker,
+            short_name=short_name,
+            legal_name=legal_name,
+            limit=limit,
+        )
+        return [record async for record in records]
+
+    def iter_government_awards(
+        self,
+        *,
+        id: Optional[str] = None,
+        ticker: Optional[str] = None,
+        short_name: Optional[str] = None,
+        legal_name: Optional[str] = None,
+        limit: int = 250,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield government award records as the driver streams them.
+
+        Same arguments and record shape as `find_government_awards`. Inputs are
+        validated and the query is built eagerly; the session stays open until
+        the returned iterator is exhausted or closed.
+        """
         # Build match clause for the entity
         match_clause, match_params = self.entitydb._build_entity_match(
             entity_var="start",
@@ -201,14 +220,9 @@ class RelationshipDetailsDB:
         LIMIT $limit
         """
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-
-        # Return records with awarded_from and affiliate fields
-        return records
+        return self.client.iter_records(cypher, params)
 
-    def find_recent_insider_activites(
+    async def find_recent_insider_activites(
         self,
         *,
         id: Optional[str] = None,
@@ -242,6 +256,32 @@ class RelationshipDetailsDB:
             List of records, each containing selected RelationshipDetail fields
             (excluding any `embedding` property).
         """
+        records = self.iter_recent_insider_activites(
+            id=id,
+            ticker=ticker,
+            short_name=short_name,
+            legal_name=legal_name,
+            start_date=start_date,
+            limit=limit,
+        )
+        return [record async for record in records]
+
+    def iter_recent_insider_activites(
+        self,
+        *,
+        id: Optional[str] = None,
+        ticker: Optional[str] = None,
+        short_name: Optional[str] = None,
+        legal_name: Optional[str] = None,
+        start_date: Optional[str] = None,
+        limit: int = 250,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield insider activity records as the driver streams them.
+
+        Same arguments and record shape as `find_recent_insider_activites`.
+        Inputs are validated and the query is built eagerly; the session stays
+        open until the returned iterator is exhausted or closed.
+        """
         # Build match clause for the entity
         match_clause, match_params = self.entitydb._build_entity_match(
             entity_var="e",
@@ -281,13 +321,9 @@ class RelationshipDetailsDB:
         LIMIT $limit
         """
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-
-        return records
+        return self.client.iter_records(cypher, params)
 
-    def find_person_entity_relationships(
+    async def find_person_entity_relationships(
         self,
         *,
         id: Optional[str] = None,
@@ -330,6 +366,38 @@ class RelationshipDetailsDB:
             List of records, each containing selected RelationshipDetail fields
             (excluding any `embedding` property).
         """
+        records = self.iter_person_entity_relationships(
+            id=id,
+            ticker=ticker,
+            short_name=short_name,
+            legal_name=legal_name,
+            person_id=person_id,
+            person_name=person_name,
+            person_sec_cik=person_sec_cik,
+            start_date=start_date,
+            limit=limit,
+        )
+        return [record async for record in records]
+
+    def iter_person_entity_relationships(
+        self,
+        *,
+        id: Optional[str] = None,
+        ticker: Optional[str] = None,
+        short_name: Optional[str] = None,
+        legal_name: Optional[str] = None,
+        person_id: Optional[str] = None,
+        person_name: Optional[str] = None,
+        person_sec_cik: Optional[str] = None,
+        start_date: Optional[str] = None,
+        limit: int = 250,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield RelationshipDetail records as the driver streams them.
+
+        Same arguments and record shape as `find_person_entity_relationships`.
+        Inputs are validated and the query is built eagerly; the session stays
+        open until the returned iterator is exhausted or closed.
+        """
         # Build match clause for the entity
         entity_match, entity_params = self.entitydb._build_entity_match(
             entity_var="e",
@@ -380,9 +448,5 @@ class RelationshipDetailsDB:
         LIMIT $limit
         """
 
-        with self.client.session() as session:
-            result: Result = session.run(cypher, params)
-            records = result.data()
-
-        return records
+        return self.client.iter_records(cypher, params)
 
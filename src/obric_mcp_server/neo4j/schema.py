@@ -0,0 +1,28 @@
+"""Indexes and constraints the query helpers rely on.
+
+Every statement is idempotent (`IF NOT EXISTS`), so applying the schema on
+each startup is safe. It is applied by `Neo4jClient.ensure_schema`.
+"""
+
+from typing import List
+
+SCHEMA_STATEMENTS: List[str] = [
+    # Entity lookups by id become an index seek instead of a label scan.
+    "CREATE CONSTRAINT entity_id IF NOT EXISTS "
+    "FOR (n:Entity) REQUIRE n.id IS UNIQUE",
+    # Relationship details are listed newest first (ORDER BY rd.created_at DESC).
+    "CREATE RANGE INDEX relationship_detail_created_at IF NOT EXISTS "
+    "FOR (rd:RelationshipDetail) ON (rd.created_at)",
+]
+
+# Vector index over RelationshipDetail embeddings. Its dimensions must match the
+# configured embedding model, so the statement is formatted at apply time.
+RELATIONSHIP_EMBEDDING_INDEX = "relationship_detail_embedding"
+RELATIONSHIP_EMBEDDING_INDEX_STATEMENT = (
+    f"CREATE VECTOR INDEX {RELATIONSHIP_EMBEDDING_INDEX} IF NOT EXISTS "
+    "FOR (rd:RelationshipDetail) ON (rd.embedding) "
+    "OPTIONS {{indexConfig: {{"
+    "`vector.dimensions`: {dimensions}, "
+    "`vector.similarity_function`: 'cosine'"
+    "}}}}"
+)
@@ -13,7 +13,7 @@ from .utils import log_mcp_tool
 
 
 @tool()
-def query_entities(
+async def query_entities(
     query: str,
     limit: int = 250,
 ) -> Dict[str, Any]:
@@ -62,7 +62,7 @@ def query_entities(
     start_time = time.time()
     log_mcp_tool("query_entities", "called", {"query": query, "limit": limit})
 
-    records = entitydb.query_entity(
+    records = await entitydb.query_entity(
         query=query,
         limit=limit,
     )
@@ -81,7 +81,7 @@ def query_entities(
 
 
 @tool()
-def find_entities_by_business_activity(
+async def find_entities_by_business_activity(
     query: str,
     direction: Optional[str] = None,
     threshold: float = 0.6,
@@ -145,11 +145,11 @@ def find_entities_by_business_activity(
     })
 
     # Generate embedding from query text
-    embedding = embedding_client.embed_text(query)
+    embedding = await embedding_client.aembed_text(query)
     embedding_dim = len(embedding) if embedding else 0
 
     # Find entities using embedding similarity
-    records = entitydb.find_entity_by_relationship_embedding(
+    records = await entitydb.find_entity_by_relationship_embedding(
         embedding=embedding,
         threshold=threshold,
         direction=direction,
@@ -173,7 +173,7 @@ def find_entities_by_business_activity(
 
 
 @tool()
-def find_affiliate_entities(
+async def find_affiliate_entities(
     id: Optional[str] = None,
     ticker: Optional[str] = None,
     short_name: Optional[str] = None,
@@ -242,7 +242,7 @@ def find_affiliate_entities(
         "limit": limit,
     })
 
-    records = entitydb.find_affiliate_entities(
+    records = await entitydb.find_affiliate_entities(
         id=id,
         ticker=ticker,
         short_name=short_name,
@@ -14,7 +14,7 @@ from .utils import log_mcp_tool
 
 
 @tool()
-def find_related_entities(
+async def find_related_entities(
     id: Optional[str] = None,
     ticker: Optional[str] = None,
     short_name: Optional[str] = None,
@@ -97,7 +97,7 @@ def find_related_entities(
         "limit": limit,
     })
 
-    records: List[Dict[str, Any]] = neighbourhooddb.find_connected_entities(
+    records: List[Dict[str, Any]] = await neighbourhooddb.find_connected_entities(
         id=id,
         ticker=ticker,
         short_name=short_name,
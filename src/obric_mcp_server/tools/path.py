@@ -14,7 +14,7 @@ from .utils import log_mcp_tool
 
 
 @tool()
-def find_paths_between_entities(
+async def find_paths_between_entities(
     id1: Optional[str] = None,
     ticker1: Optional[str] = None,
     short_name1: Optional[str] = None,
@@ -142,7 +142,7 @@ def find_paths_between_entities(
         "max_paths": max_paths,
     })
 
-    paths = pathdb.find_paths_between_entities(
+    paths = await pathdb.find_paths_between_entities(
         id1=id1,
         ticker1=ticker1,
         short_name1=short_name1,
@@ -13,7 +13,7 @@ from .utils import log_mcp_tool
 
 
 @tool()
-def query_person(
+async def query_person(
     id: Optional[str] = None,
     name: Optional[str] = None,
     limit: int = 250,
@@ -48,7 +48,7 @@ def query_person(
         "limit": limit,
     })
 
-    records = persondb.query_person(id=id, name=name, limit=limit)
+    records = await persondb.query_person(id=id, name=name, limit=limit)
 
     duration = time.time() - start_time
     log_mcp_tool("query_person", "completed", {
@@ -65,7 +65,7 @@ def query_person(
 
 
 @tool()
-def find_people_by_entity(
+async def find_people_by_entity(
     id: Optional[str] = None,
     ticker: Optional[str] = None,
     short_name: Optional[str] = None,
@@ -114,7 +114,7 @@ def find_people_by_entity(
         "limit": limit,
     })
 
-    records = persondb.find_people_by_entity(
+    records = await persondb.find_people_by_entity(
         id=id,
         ticker=ticker,
         short_name=short_name,
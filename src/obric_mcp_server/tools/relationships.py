@@ -13,7 +13,7 @@ from .utils import log_mcp_tool
 
 
 @tool()
-def find_government_awards(
+async def find_government_awards(
     id: Optional[str] = None,
     ticker: Optional[str] = None,
     short_name: Optional[str] = None,
@@ -88,7 +88,7 @@ def find_government_awards(
         "limit": limit,
     })
 
-    records = relationship_detailsdb.find_government_awards(
+    records = await relationship_detailsdb.find_government_awards(
         id=id,
         ticker=ticker,
         short_name=short_name,
@@ -113,7 +113,7 @@ def find_government_awards(
 
 
 @tool()
-def find_recent_insider_activities(
+async def find_recent_insider_activities(
     id: Optional[str] = None,
     ticker: Optional[str] = None,
     short_name: Optional[str] = None,
@@ -173,7 +173,7 @@ def find_recent_insider_activities(
         "limit": limit,
     })
 
-    records = relationship_detailsdb.find_recent_insider_activites(
+    records = await relationship_detailsdb.find_recent_insider_activites(
         id=id,
         ticker=ticker,
         short_name=short_name,
@@ -200,7 +200,7 @@ def find_recent_insider_activities(
 
 
 @tool()
-def find_person_entity_relationships(
+async def find_person_entity_relationships(
     id: Optional[str] = None,
     ticker: Optional[str] = None,
     short_name: Optional[str] = None,
@@ -277,7 +277,7 @@ def find_person_entity_relationships(
         "limit": limit,
     })
 
-    records = relationship_detailsdb.find_person_entity_relationships(
+    records = await relationship_detailsdb.find_person_entity_relationships(
         id=id,
         ticker=ticker,
         short_name=short_name,
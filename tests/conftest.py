@@ -0,0 +1,17 @@
+"""Shared test setup: import the package from src/ with a dummy configuration."""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+# Config requires these; tests never talk to Neo4j or OpenAI.
+for name, value in {
+    "NEO4J_URI": "bolt://localhost:7687",
+    "NEO4J_USERNAME": "neo4j",
+    "NEO4J_PASSWORD": "password",
+    "NEO4J_DATABASE": "neo4j",
+    "OPENAI_API_KEY": "test-key",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,69 @@
+"""Tests for the CLI commands and their streaming JSON output."""
+
+import argparse
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict
+
+import pytest
+
+from obric_mcp_server.cli import _cmd_find_entities_by_ids, _stream_json
+
+
+async def _failing_records() -> AsyncIterator[Dict[str, Any]]:
+    yield {"id": "1"}
+    raise RuntimeError("connection lost")
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_failure_mid_stream_still_writes_valid_json(
+    capsysbinary: pytest.CaptureFixture[bytes], pretty: bool
+) -> None:
+    with pytest.raises(RuntimeError, match="connection lost"):
+        asyncio.run(
+            _stream_json({"tier": 1}, "results", _failing_records(), pretty=pretty)
+        )
+
+    assert json.loads(capsysbinary.readouterr().out) == {
+        "tier": 1,
+        "results": [{"id": "1"}],
+        "error": "connection lost",
+        "count": 1,
+    }
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_stream_writes_meta_items_and_count(
+    capsysbinary: pytest.CaptureFixture[bytes], pretty: bool
+) -> None:
+    async def records() -> AsyncIterator[Dict[str, Any]]:
+        for i in range(3):
+            yield {"id": str(i)}
+
+    asyncio.run(_stream_json({}, "results", records(), pretty=pretty))
+
+    assert json.loads(capsysbinary.readouterr().out) == {
+        "results": [{"id": "0"}, {"id": "1"}, {"id": "2"}],
+        "count": 3,
+    }
+
+
+def test_find_entities_by_ids_prints_found_and_missing(
+    capsysbinary: pytest.CaptureFixture[bytes],
+) -> None:
+    class _Client:
+        async def iter_records(self, cypher: str, params: Dict[str, Any]):
+            yield {"id": "b", "node": {"id": "b"}}
+            yield {"id": "a", "node": {"id": "a"}}
+
+    args = argparse.Namespace(ids=["a", "x", "b", "a"], pretty=False)
+    asyncio.run(_cmd_find_entities_by_ids(args, _Client()))  # type: ignore[arg-type]
+
+    assert json.loads(capsysbinary.readouterr().out) == {
+        "missing": ["x"],
+        "results": [
+            {"id": "a", "entity": {"id": "a"}},
+            {"id": "b", "entity": {"id": "b"}},
+        ],
+        "count": 2,
+    }
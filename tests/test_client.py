@@ -0,0 +1,98 @@
+"""Tests for Neo4jClient session sharing."""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from obric_mcp_server.neo4j import Neo4jClient
+
+
+class _FakeResult:
+    def __init__(self, session: "_FakeSession", rows: List[Dict[str, Any]]) -> None:
+        self._session = session
+        self._rows = iter(rows)
+
+    def __aiter__(self) -> "_FakeResult":
+        return self
+
+    async def __anext__(self) -> Any:
+        # Like the driver, a newer query on the session invalidates this result.
+        if self._session.result is not self:
+            raise RuntimeError("result consumed")
+        try:
+            return _FakeRecord(next(self._rows))
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class _FakeRecord:
+    def __init__(self, row: Dict[str, Any]) -> None:
+        self._row = row
+
+    def data(self) -> Dict[str, Any]:
+        return dict(self._row)
+
+
+class _FakeSession:
+    def __init__(self, kwargs: Dict[str, Any]) -> None:
+        self.kwargs = kwargs
+        self.result: Optional[_FakeResult] = None
+        self.closed = False
+
+    async def run(
+        self, cypher: str, params: Optional[Dict[str, Any]] = None
+    ) -> _FakeResult:
+        self.result = _FakeResult(self, [{"n": 1}, {"n": 2}])
+        return self.result
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeDriver:
+    def __init__(self) -> None:
+        self.sessions: List[_FakeSession] = []
+
+    def session(self, **kwargs: Any) -> _FakeSession:
+        self.sessions.append(_FakeSession(kwargs))
+        return self.sessions[-1]
+
+
+def _client() -> tuple[Neo4jClient, _FakeDriver]:
+    client = Neo4jClient()
+    driver = _FakeDriver()
+    client._driver = driver  # type: ignore[assignment]
+    return client, driver
+
+
+async def _stream_with_nested_queries(client: Neo4jClient) -> List[Dict[str, Any]]:
+    seen = []
+    async for record in client.iter_records("MATCH (n) RETURN n"):
+        seen.append(record)
+        async with client.session() as session:
+            await session.run("MATCH (m) RETURN m")
+    return seen
+
+
+def test_nested_query_during_iteration_gets_its_own_session() -> None:
+    client, driver = _client()
+
+    assert asyncio.run(_stream_with_nested_queries(client)) == [{"n": 1}, {"n": 2}]
+    # One streaming session plus one per nested query; all closed.
+    assert len(driver.sessions) == 3
+    assert all(session.closed for session in driver.sessions)
+
+
+def test_streaming_session_inherits_enclosing_options_but_is_not_shared() -> None:
+    client, driver = _client()
+
+    async def run() -> List[Dict[str, Any]]:
+        async with client.session(fetch_size=5) as outer:
+            records = await _stream_with_nested_queries(client)
+            assert outer.result is not None  # nested queries reused `outer`
+            return records
+
+    assert asyncio.run(run()) == [{"n": 1}, {"n": 2}]
+    outer, streaming = driver.sessions
+    assert streaming is not outer
+    assert streaming.kwargs["fetch_size"] == 5
+    assert streaming.closed and outer.closed
@@ -0,0 +1,146 @@
+"""Tests for `EmbeddingClient` batching and caching."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from obric_mcp_server.llm.embeddings import EmbeddingClient
+
+
+class _ShortEmbeddings:
+    """Returns one vector fewer than the number of texts requested."""
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [[1.0] for _ in texts[1:]]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_documents(texts)
+
+
+class _HangingEmbeddings:
+    """Never answers, so the flush task can be cancelled mid-request."""
+
+    def __init__(self) -> None:
+        self.started = asyncio.Event()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.started.set()
+        await asyncio.Event().wait()
+        return []
+
+
+class _CountingEmbeddings:
+    """Returns a distinct vector per text and counts the texts requested."""
+
+    def __init__(self) -> None:
+        self.requested: List[str] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.requested.extend(texts)
+        return [[float(len(text)), 0.5] for text in texts]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_documents(texts)
+
+
+def _client(embeddings: object) -> EmbeddingClient:
+    client = EmbeddingClient()
+    # Replace the lazily built OpenAIEmbeddings instance (a cached_property).
+    client.__dict__["embeddings"] = embeddings
+    return client
+
+
+def test_short_result_fails_every_caller() -> None:
+    client = _client(_ShortEmbeddings())
+
+    async def run() -> list:
+        return await asyncio.wait_for(
+            asyncio.gather(
+                client.aembed_text("a"),
+                client.aembed_text("b"),
+                return_exceptions=True,
+            ),
+            timeout=1,
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    # Nothing from the mismatched response was cached.
+    assert client._cache_get("a") is None
+
+
+def test_short_result_fails_batch_embedding() -> None:
+    client = _client(_ShortEmbeddings())
+
+    with pytest.raises(RuntimeError, match="returned 1 vectors for 2 texts"):
+        client.embed_texts(["a", "b", "a"])
+    assert client._cache_get("a") is None
+
+
+def test_cancelled_flush_settles_waiting_callers() -> None:
+    embeddings = _HangingEmbeddings()
+    client = _client(embeddings)
+
+    async def run() -> None:
+        caller = asyncio.ensure_future(client.aembed_text("a"))
+        await asyncio.sleep(0)  # let the caller queue its text
+        flush_task = client._flush_task
+        assert flush_task is not None
+        await asyncio.wait_for(embeddings.started.wait(), timeout=1)
+        flush_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(caller, timeout=1)
+
+    asyncio.run(run())
+
+
+def test_cancelled_before_request_settles_waiting_callers() -> None:
+    client = _client(_HangingEmbeddings())
+
+    async def run() -> None:
+        caller = asyncio.ensure_future(client.aembed_text("a"))
+        await asyncio.sleep(0)  # let the caller queue its text
+        assert client._flush_task is not None
+        client._flush_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(caller, timeout=1)
+        assert client._flush_task is None and client._pending == []
+
+    asyncio.run(run())
+
+
+def test_cached_vectors_survive_caller_mutation() -> None:
+    embeddings = _CountingEmbeddings()
+    client = _client(embeddings)
+
+    client.embed_text("ab").append(9.0)
+    first, duplicate = client.embed_texts(["ab", "ab"])
+    first[0] = -1.0
+
+    assert duplicate == [2.0, 0.5]
+    assert client.embed_text("ab") == [2.0, 0.5]
+    assert asyncio.run(client.aembed_text("ab")) == [2.0, 0.5]
+    assert embeddings.requested == ["ab"]
+
+
+def test_identical_texts_in_one_batch_are_requested_once() -> None:
+    embeddings = _CountingEmbeddings()
+    client = _client(embeddings)
+
+    async def run() -> list:
+        return await asyncio.wait_for(
+            asyncio.gather(
+                client.aembed_text("ab"),
+                client.aembed_text("c"),
+                client.aembed_text("ab"),
+            ),
+            timeout=1,
+        )
+
+    first, other, duplicate = asyncio.run(run())
+
+    assert embeddings.requested == ["ab", "c"]
+    assert first == duplicate == [2.0, 0.5]
+    assert first is not duplicate
+    assert other == [1.0, 0.5]
@@ -0,0 +1,72 @@
+"""Tests for EntityDB's batched lookups."""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from obric_mcp_server.neo4j import EntityDB
+
+
+class _FakeClient:
+    """Stands in for Neo4jClient; returns canned rows and records each query."""
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self.rows = rows
+        self.queries: List[Dict[str, Any]] = []
+
+    async def iter_records(self, cypher: str, params: Optional[Dict[str, Any]] = None):
+        self.queries.append({"cypher": cypher, "params": params})
+        for row in self.rows:
+            yield row
+
+
+def test_find_entities_by_ids_maps_found_ids_and_queries_each_once() -> None:
+    client = _FakeClient(
+        [
+            {"id": "a", "node": {"id": "a", "short_name": "Acme"}},
+            {"id": "c", "node": {"id": "c", "short_name": "Cyan"}},
+        ]
+    )
+    db = EntityDB(client)  # type: ignore[arg-type]
+
+    found = asyncio.run(db.find_entities_by_ids(["a", "b", "a", "c"]))
+
+    assert found == {
+        "a": {"id": "a", "short_name": "Acme"},
+        "c": {"id": "c", "short_name": "Cyan"},
+    }
+    assert len(client.queries) == 1
+    assert client.queries[0]["params"] == {"ids": ["a", "b", "c"]}
+    assert "UNWIND $ids AS id" in client.queries[0]["cypher"]
+
+
+def test_find_entities_by_ids_skips_the_query_for_no_ids() -> None:
+    client = _FakeClient([])
+    db = EntityDB(client)  # type: ignore[arg-type]
+
+    assert asyncio.run(db.find_entities_by_ids([])) == {}
+    assert client.queries == []
+
+
+def test_find_entities_by_tickers_matches_case_insensitively() -> None:
+    client = _FakeClient([{"ticker": "acme", "node": {"id": "1", "ticker": "ACME"}}])
+    db = EntityDB(client)  # type: ignore[arg-type]
+
+    found = asyncio.run(db.find_entities_by_tickers(["ACME", " acme ", "", "nope"]))
+
+    assert found == {
+        "ACME": {"id": "1", "ticker": "ACME"},
+        " acme ": {"id": "1", "ticker": "ACME"},
+    }
+    assert client.queries[0]["params"] == {"tickers": ["acme", "nope"]}
+
+
+def test_find_entities_by_tickers_picks_the_first_entity_by_id() -> None:
+    client = _FakeClient([])
+    db = EntityDB(client)  # type: ignore[arg-type]
+
+    asyncio.run(db.find_entities_by_tickers(["ACME"]))
+
+    # Several entities may share a ticker; the query must order them before
+    # taking the first so the choice is deterministic.
+    cypher = " ".join(client.queries[0]["cypher"].split())
+    assert "ORDER BY n.id RETURN ticker, collect(properties(n))[0] AS node" in cypher
@@ -0,0 +1,113 @@
+"""Tests that cached query results can't be corrupted by callers."""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from obric_mcp_server.neo4j import EntityDB, NeighbourhoodDB
+
+
+class _FakeResult:
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self._rows = iter(rows)
+
+    def __aiter__(self) -> "_FakeResult":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        try:
+            return next(self._rows)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class _FakeSession:
+    def __init__(self, client: "_FakeClient") -> None:
+        self._client = client
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def run(self, cypher: str, params: Optional[Dict[str, Any]] = None) -> _FakeResult:
+        self._client.queries += 1
+        return _FakeResult(self._client.make_rows())
+
+
+class _FakeClient:
+    """Stands in for Neo4jClient; every query returns fresh rows."""
+
+    def __init__(self, column: str) -> None:
+        self.column = column
+        self.queries = 0
+
+    def make_rows(self) -> List[Dict[str, Any]]:
+        return [{self.column: {"id": "1", "short_name": "Acme"}, "tier": 1}]
+
+    def session(self) -> _FakeSession:
+        return _FakeSession(self)
+
+    async def iter_records(self, cypher: str, params: Optional[Dict[str, Any]] = None):
+        self.queries += 1
+        for row in self.make_rows():
+            yield row
+
+
+def _mutate(records: List[Dict[str, Any]]) -> None:
+    records[0]["short_name"] = "changed"
+    records[0].pop("id")
+    records.append({"id": "extra"})
+
+
+def test_query_entity_cache_survives_caller_mutation() -> None:
+    client = _FakeClient("node")
+    db = EntityDB(client)  # type: ignore[arg-type]
+
+    async def run() -> List[Dict[str, Any]]:
+        _mutate(await db.query_entity(query="acme"))
+        return await db.query_entity(query="ACME")
+
+    assert asyncio.run(run()) == [{"id": "1", "short_name": "Acme"}]
+    assert client.queries == 1
+
+
+def test_relationship_query_cache_survives_caller_mutation() -> None:
+    client = _FakeClient("entity")
+    db = EntityDB(client)  # type: ignore[arg-type]
+
+    async def run() -> List[Dict[str, Any]]:
+        _mutate(await db.find_entity_by_relationship_query(query="supplier"))
+        return await db.find_entity_by_relationship_query(query="supplier")
+
+    assert asyncio.run(run()) == [{"id": "1", "short_name": "Acme"}]
+    assert client.queries == 1
+
+
+def test_connected_entities_cache_survives_caller_mutation() -> None:
+    client = _FakeClient("entity")
+    db = NeighbourhoodDB(client)  # type: ignore[arg-type]
+
+    async def run() -> List[Dict[str, Any]]:
+        _mutate(await db.find_connected_entities(id="start"))
+        return await db.find_connected_entities(id="start")
+
+    assert asyncio.run(run()) == [{"id": "1", "short_name": "Acme", "tier": 1}]
+    assert client.queries == 1
+
+
+def test_entity_lookup_is_cached_once_fully_read() -> None:
+    client = _FakeClient("node")
+    db = EntityDB(client)  # type: ignore[arg-type]
+
+    async def run() -> List[Dict[str, Any]]:
+        # Closed early: possibly incomplete, so not cached.
+        records = db.iter_entity(ticker="ACME")
+        await records.__anext__()
+        await records.aclose()  # type: ignore[attr-defined]
+
+        _mutate(await db.find_entity(ticker=" acme "))
+        return [record async for record in db.iter_entity(ticker="Acme")]
+
+    assert asyncio.run(run()) == [{"id": "1", "short_name": "Acme"}]
+    assert client.queries == 2